@@ -3,34 +3,98 @@ Main application class that coordinates all components of the Window Activity Lo
 """
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING, Callable
-import re
+from typing import Optional, TYPE_CHECKING, Callable, Any, List, Tuple
+import atexit
+import importlib
+import logging
 import queue
+import threading
+import time
 import tkinter as tk
 from config_manager import ConfigurationManager
 from window_monitor import WindowMonitor
-from system_tray import SystemTrayInterface
-from report_window import ReportWindow
-from settings_window import SettingsWindow
-from sql_query_window import SQLQueryWindow
-from db_management_window import DatabaseManagementWindow
 
 if TYPE_CHECKING:
     from db_manager import DatabaseManager
+    from system_tray import SystemTrayInterface
+    from report_window import ReportWindow
+    from settings_window import SettingsWindow
+    from sql_query_window import SQLQueryWindow
+    from db_management_window import DatabaseManagementWindow
+
+logger = logging.getLogger(__name__)
+
+# UI classes are imported on first use, the app starts minimized and most
+# windows are never opened in a typical session
+_LAZY_IMPORTS = {
+    "SystemTrayInterface": "system_tray",
+    "ReportWindow": "report_window",
+    "SettingsWindow": "settings_window",
+    "SQLQueryWindow": "sql_query_window",
+    "DatabaseManagementWindow": "db_management_window",
+}
+
+# DatabaseManager imports this module for type hints, so it is bound on first use
+_DatabaseManager = None
+
+def _get_db_manager_cls() -> type:
+    """Get the DatabaseManager class, importing it once on first call."""
+    global _DatabaseManager
+    if _DatabaseManager is None:
+        from db_manager import DatabaseManager
+        _DatabaseManager = DatabaseManager
+    return _DatabaseManager
+
+def _lazy_import(name: str) -> Any:
+    """Import a lazily loaded class and cache it in the module namespace.
+
+    Args:
+        name: Name of the class as listed in _LAZY_IMPORTS
+
+    Returns:
+        The imported class
+    """
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported classes on module attribute access."""
+    if name in _LAZY_IMPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Application:
+    __slots__ = (
+        "_config_manager", "configuration", "_db_manager", "_window_monitor",
+        "_tray_interface", "_report_window", "_settings_window", "_sql_query_window",
+        "_db_management_window", "_is_running", "_db_queue", "_db_thread",
+        "_has_patterns", "_compiled_ignore", "_root"
+    )
+
+    # Title changes closer together than this are logged as one change
+    _TITLE_SETTLE_SECONDS = 1.5
+    # Settled title changes are written together at most this often
+    _WRITE_INTERVAL_SECONDS = 2.0
+    # Settled title changes kept for retrying while writes fail, older ones are dropped
+    _MAX_UNWRITTEN_CHANGES = 10000
+
     def __init__(self):
         """Initialize the application and its components."""
         self._config_manager: Optional[ConfigurationManager] = None
+        self.configuration: Optional[ConfigurationManager] = None  # Set once the config is loaded
         self._db_manager: Optional['DatabaseManager'] = None
         self._window_monitor: Optional[WindowMonitor] = None
-        self._tray_interface: Optional[SystemTrayInterface] = None
-        self._report_window: Optional[ReportWindow] = None
-        self._settings_window: Optional[SettingsWindow] = None
-        self._sql_query_window: Optional[SQLQueryWindow] = None
-        self._db_management_window: Optional[DatabaseManagementWindow] = None
+        self._tray_interface: Optional['SystemTrayInterface'] = None
+        self._report_window: Optional['ReportWindow'] = None
+        self._settings_window: Optional['SettingsWindow'] = None
+        self._sql_query_window: Optional['SQLQueryWindow'] = None
+        self._db_management_window: Optional['DatabaseManagementWindow'] = None
         self._is_running = False
-        self._ui_queue = queue.Queue()
+        self._db_queue = queue.Queue()  # (title, timestamp) pairs, None stops the writer
+        self._db_thread: Optional[threading.Thread] = None
+        self._has_patterns = False  # Whether any ignore patterns are configured
+        self._compiled_ignore: Optional[Any] = None  # Built lazily on the first title change
         
         # Create root window but keep it hidden
         self._root = tk.Tk()
@@ -51,17 +115,6 @@ class Application:
         """Whether the application is currently running."""
         return self._is_running
 
-    @property
-    def configuration(self) -> ConfigurationManager:
-        """Get the configuration manager.
-
-        Returns:
-            The application's configuration manager
-        """
-        if self._config_manager is None:
-            raise RuntimeError("Configuration manager not initialized")
-        return self._config_manager
-
     def initialize(self) -> bool:
         """Initialize all components of the application."""
         try:
@@ -69,15 +122,15 @@ class Application:
             self._config_manager = ConfigurationManager(self)
             if not self._config_manager.load():
                 return False
+            self.configuration = self._config_manager
+
+            self._has_patterns = bool(self._config_manager.get_regex_patterns())
 
             # Register for configuration updates
             self._config_manager.add_update_handler(self._handle_config_changed)
 
-            # Import here to avoid circular dependency
-            from db_manager import DatabaseManager
-
             # Initialize database manager
-            self._db_manager = DatabaseManager(self)
+            self._db_manager = _get_db_manager_cls()(self)
             if not self._db_manager.initialize():
                 return False
 
@@ -86,14 +139,10 @@ class Application:
             if not self._window_monitor.initialize():
                 return False
 
-            # Initialize UI components
-            self._report_window = ReportWindow(self._db_manager)
-            self._settings_window = SettingsWindow(self._config_manager)
-            self._sql_query_window = SQLQueryWindow(self._db_manager)
-            self._db_management_window = DatabaseManagementWindow(self, self._db_manager)
+            # UI windows are created on first show request
 
             # Initialize system tray
-            self._tray_interface = SystemTrayInterface()
+            self._tray_interface = _lazy_import("SystemTrayInterface")()
             if not self._tray_interface.initialize():
                 return False
 
@@ -108,12 +157,22 @@ class Application:
             return True
 
         except Exception as e:
-            print(f"Error initializing application: {e}")
+            logger.error("Error initializing application: %s", e)
             return False
 
     def start(self) -> None:
         """Start the application and all its components."""
         if not self._is_running:
+            # Start the database writer before anything can queue title changes
+            self._db_thread = threading.Thread(
+                target=self._db_worker,
+                name="DatabaseWriter",
+                daemon=True
+            )
+            self._db_thread.start()
+            # Pending title changes are written even if the event loop ends abnormally
+            atexit.register(self._stop_database_writer)
+
             # Start core components
             if self._window_monitor:
                 self._window_monitor.start()
@@ -139,11 +198,12 @@ class Application:
             if self._sql_query_window:
                 self._sql_query_window.hide()
             if self._db_management_window:
-                self._db_management_window._on_close()
+                self._db_management_window.shutdown()
 
             # Stop background components in reverse order of initialization
             if self._window_monitor:
                 self._window_monitor.stop()
+            self._stop_database_writer()
             if self._tray_interface:
                 self._tray_interface.cleanup()
 
@@ -151,7 +211,22 @@ class Application:
             if self._root:
                 self._root.after(0, self._destroy_root)
         except Exception as e:
-            print(f"Error cleaning up components: {e}")
+            logger.error("Error cleaning up components: %s", e)
+
+    def _stop_database_writer(self) -> None:
+        """Let the database writer flush pending title changes, then close the database.
+
+        Safe to call more than once, stop() calls it and it is registered with atexit.
+        """
+        try:
+            if self._db_thread:
+                self._db_queue.put(None)
+                self._db_thread.join()
+                self._db_thread = None
+            if self._db_manager:
+                self._db_manager.close()
+        except Exception as e:
+            logger.error("Error stopping database writer: %s", e)
 
     def _destroy_root(self) -> None:
         """Destroy the root window safely in the main thread."""
@@ -161,26 +236,7 @@ class Application:
                 self._root.destroy()
                 self._root = None
         except Exception as e:
-            print(f"Error destroying root window: {e}")
-
-    def process_ui_events(self) -> None:
-        """Process any pending UI events in the main thread."""
-        try:
-            # Process Tkinter events
-            self._root.update()
-            
-            # Process queued UI actions
-            while True:
-                # Get all pending UI actions without blocking
-                action = self._ui_queue.get_nowait()
-                if action:
-                    action()
-                self._ui_queue.task_done()
-        except queue.Empty:
-            pass  # No more events to process
-        except tk.TclError:
-            # Root window was destroyed, exit the application
-            self._is_running = False
+            logger.error("Error destroying root window: %s", e)
 
     def _queue_ui_action(self, action: Callable[[], None]) -> None:
         """Queue a UI action to be executed in the main thread.
@@ -188,7 +244,8 @@ class Application:
         Args:
             action: The function to execute in the main thread
         """
-        self._ui_queue.put(action)
+        if self._root:
+            self._root.after(0, action)
 
     def _handle_window_title_changed(self, timestamp: datetime, old_title: str, new_title: str) -> bool:
         """Handle window title change events.
@@ -207,55 +264,165 @@ class Application:
                 return False
 
             # Check if title matches any ignore patterns
-            for pattern in self.configuration.get_regex_patterns():
-                if re.match(pattern, new_title):
+            if self._has_patterns:
+                pattern = self._compiled_ignore or self._rebuild_ignore()
+                if pattern and pattern.search(new_title):
                     return False
 
-            # Update database if we have a valid title change
+            # Hand the title change to the database writer thread
             if self._db_manager:
-                self._db_manager.log_window_title(new_title, timestamp)
+                self._db_queue.put((new_title, timestamp))
             return True
 
         except Exception as e:
-            print(f"Error handling window title change: {e}")
+            logger.error("Error handling window title change: %s", e)
             return False
 
+    def _rebuild_ignore(self) -> Optional[Any]:
+        """Fetch the compiled ignore pattern from the configuration manager.
+
+        Returns:
+            The combined ignore pattern, or None if no patterns are configured
+        """
+        self._compiled_ignore = self._config_manager.get_compiled_patterns()
+        return self._compiled_ignore
+
+    def _db_worker(self) -> None:
+        """Write queued title changes to the database once they have settled.
+
+        Changes arriving within _TITLE_SETTLE_SECONDS of the first change of a
+        burst are coalesced: only the last title is logged, with the time it
+        appeared, so the previous entry runs until then. A burst that ends on
+        the title logged before it is dropped, that entry just continues.
+        Settled changes are collected for _WRITE_INTERVAL_SECONDS and written
+        in one transaction, a failed write is retried with the next one.
+        """
+        pending = None  # (title, timestamp) waiting for the burst to end
+        last_title = None  # Title of the last settled change, None if its entry is unknown
+        open_log_id = None  # Entry the last write left open for last_title
+        settle_at = 0.0
+        batch: List[Tuple[str, datetime]] = []  # Settled changes waiting to be written
+        write_at = 0.0
+        while True:
+            wake_times = []
+            if pending is not None:
+                wake_times.append(settle_at)
+            if batch:
+                wake_times.append(write_at)
+            timeout = max(0.0, min(wake_times) - time.monotonic()) if wake_times else None
+            try:
+                item = self._db_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()  # Woken up to settle or write
+
+            # The entry of the last title can be closed or deleted from elsewhere,
+            # like a database switch or the management window
+            if not batch and (open_log_id is None or self._db_manager.open_log_id != open_log_id):
+                last_title = None
+
+            if item is None:
+                # Flush what is left before exiting
+                if pending is not None and pending[0] != last_title:
+                    batch.append(pending)
+                if batch and not self._db_manager.log_window_titles(batch):
+                    logger.error("Dropped %d title changes that could not be written", len(batch))
+                return
+
+            now = time.monotonic()
+            if pending is not None and now >= settle_at:
+                # Nothing newer arrived in time, the pending title has settled
+                if pending[0] != last_title:
+                    if not batch:
+                        write_at = now + self._WRITE_INTERVAL_SECONDS
+                    batch.append(pending)
+                    last_title = pending[0]
+                pending = None
+
+            if item:
+                if pending is None:
+                    pending = item
+                    settle_at = now + self._TITLE_SETTLE_SECONDS
+                else:
+                    pending = item  # The burst still settles at the same time
+
+            if batch and now >= write_at:
+                if self._db_manager.log_window_titles(batch):
+                    batch = []
+                    open_log_id = self._db_manager.open_log_id
+                else:
+                    # Keep the changes for the next write, up to a limit, the
+                    # next change is logged even if it repeats the last title
+                    last_title = None
+                    write_at = now + self._WRITE_INTERVAL_SECONDS
+                    if len(batch) > self._MAX_UNWRITTEN_CHANGES:
+                        dropped = len(batch) - self._MAX_UNWRITTEN_CHANGES
+                        del batch[:dropped]
+                        logger.error("Dropped %d title changes that could not be written", dropped)
+
     def _handle_exit_request(self) -> None:
         """Handle application exit request from system tray."""
         try:
             # Queue stop to run in main thread
             self._queue_ui_action(self.stop)
         except Exception as e:
-            print(f"Error during exit: {e}")
+            logger.error("Error during exit: %s", e)
             self._is_running = False  # Ensure we still exit even if there's an error
 
+    def _get_report_window(self) -> 'ReportWindow':
+        """Get the report window, creating it on first use."""
+        if self._report_window is None:
+            self._report_window = _lazy_import("ReportWindow")(self._db_manager)
+        return self._report_window
+
+    def _get_settings_window(self) -> 'SettingsWindow':
+        """Get the settings window, creating it on first use."""
+        if self._settings_window is None:
+            self._settings_window = _lazy_import("SettingsWindow")(self._config_manager)
+        return self._settings_window
+
+    def _get_sql_query_window(self) -> 'SQLQueryWindow':
+        """Get the SQL query window, creating it on first use."""
+        if self._sql_query_window is None:
+            self._sql_query_window = _lazy_import("SQLQueryWindow")(self._db_manager)
+        return self._sql_query_window
+
+    def _get_db_management_window(self) -> 'DatabaseManagementWindow':
+        """Get the database management window, creating it on first use."""
+        if self._db_management_window is None:
+            self._db_management_window = _lazy_import("DatabaseManagementWindow")(self, self._db_manager)
+        return self._db_management_window
+
     def _handle_show_report(self) -> None:
         """Handle show report window request from system tray."""
-        if self._report_window:
+        if self._db_manager:
             # Queue the window show operation to run in main thread
-            self._queue_ui_action(lambda: self._report_window.show())
+            self._queue_ui_action(lambda: self._get_report_window().show())
 
     def _handle_show_settings(self) -> None:
         """Handle show settings window request from system tray."""
-        if self._settings_window:
+        if self._config_manager:
             # Queue the window show operation to run in main thread
-            self._queue_ui_action(lambda: self._settings_window.show())
+            self._queue_ui_action(lambda: self._get_settings_window().show())
 
     def _handle_show_sql_query(self) -> None:
         """Handle show SQL query window request from system tray."""
-        if self._sql_query_window:
+        if self._db_manager:
             # Queue the window show operation to run in main thread
-            self._queue_ui_action(lambda: self._sql_query_window.show())
+            self._queue_ui_action(lambda: self._get_sql_query_window().show())
             
     def _handle_show_db_management(self) -> None:
         """Handle show database management window request from system tray."""
-        if self._db_management_window:
+        if self._db_manager:
             # Queue the window show operation to run in main thread
-            self._queue_ui_action(lambda: self._db_management_window.show())
+            self._queue_ui_action(lambda: self._get_db_management_window().show())
 
     def _handle_config_changed(self) -> None:
         """Handle configuration changes from any source."""
         try:
+            # Rebuild the ignore pattern on the next title change
+            self._has_patterns = bool(self._config_manager.get_regex_patterns())
+            self._compiled_ignore = None
+
             # Queue UI actions to happen in the main thread
             def update_actions():
                 # Config changes may require UI updates
@@ -268,4 +435,4 @@ class Application:
             self._queue_ui_action(update_actions)
 
         except Exception as e:
-            print(f"Error handling configuration change: {e}")
+            logger.error("Error handling configuration change: %s", e)
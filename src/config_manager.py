@@ -2,14 +2,200 @@
 Configuration manager for handling application settings and JSON configuration file.
 """
 import json
+import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Callable, Union, TYPE_CHECKING
+
+try:
+    import orjson  # Optional, faster serialization when installed
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan  # Optional, DFA based matching for large pattern sets
+except ImportError:
+    hyperscan = None
 
 if TYPE_CHECKING:
     from application import Application
 
+logger = logging.getLogger(__name__)
+
+# Application data directory under the user's Documents folder, fixed for the process lifetime
+_WINDOW_LOGGER_DIR = Path(os.environ.get("USERPROFILE", os.path.expanduser("~"))) / "Documents" / "WindowLogger"
+_CONFIG_PATH = _WINDOW_LOGGER_DIR / "config.json"
+_DEFAULT_DB = _WINDOW_LOGGER_DIR / "activity.db"
+
+# Version of the config file layout, stored so later layouts can be told apart
+_SCHEMA_VERSION = 1
+
+# Below this many patterns the combined re alternation is fast enough
+_HYPERSCAN_MIN_PATTERNS = 16
+
+# Matches the global inline flags such as (?i)(?s) at the start of a pattern
+_GLOBAL_FLAGS_RE = re.compile(r"(?:\(\?[aiLmsux]+\))+")
+
+def _pattern_group(pattern: str) -> str:
+    """Turn a title filter pattern into a group of the combined ignore regex.
+
+    Patterns are written for re.match semantics. A trailing .* never changes
+    whether a match exists and is dropped. A leading .* only makes the engine
+    try every start position itself, so those patterns are left unanchored
+    for search(), all others are anchored to the start of the title.
+
+    Args:
+        pattern: Regex pattern as entered by the user
+
+    Returns:
+        The pattern wrapped in a (possibly scoped flag) group
+    """
+    # Leading global flags like (?i) are only valid at the start of the
+    # whole expression, so turn them into scoped groups before joining
+    flags = _GLOBAL_FLAGS_RE.match(pattern)
+    letters = "".join(dict.fromkeys(flags.group().replace("(?", "").replace(")", ""))) if flags else ""
+    prefix = f"(?{letters}:" if flags else "(?:"
+    body = pattern[flags.end():] if flags else pattern
+
+    # Drop a trailing .* unless its dot is escaped
+    if body.endswith(".*"):
+        head = body[:-2]
+        if (len(head) - len(head.rstrip("\\"))) % 2 == 0:
+            body = head
+
+    # A leading .* can only be dropped if it applies to every alternative
+    anchor = "\\A"
+    if "|" not in body and body.startswith(".*") and body[2:3] not in ("?", "+"):
+        body = body[2:]
+        anchor = ""
+    return f"{anchor}{prefix}{body})"
+
+class _HyperscanMatcher:
+    """Title filter backed by a Hyperscan database, used like a compiled re."""
+
+    def __init__(self, expressions: List[str], fallback: re.Pattern):
+        """Compile the expressions into a single Hyperscan database.
+
+        Args:
+            expressions: Pattern groups as built by _pattern_group
+            fallback: The same groups compiled with re, for titles Hyperscan cannot scan
+        """
+        self._fallback = fallback
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[e.encode("utf-8") for e in expressions],
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(expressions)
+        )
+
+    def search(self, title: str) -> bool:
+        """Check whether any pattern matches the title.
+
+        Args:
+            title: Window title to check
+
+        Returns:
+            bool: True if at least one pattern matched
+        """
+        try:
+            data = title.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates, Hyperscan only scans valid UTF-8
+            return self._fallback.search(title) is not None
+
+        def on_match(*_args) -> bool:
+            return True  # Stop at the first match, scan() then raises ScanTerminated
+
+        try:
+            self._db.scan(data, match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+class _PatternList:
+    """Title filter that matches the patterns one by one, used like a compiled re.
+
+    Used for patterns that cannot be joined into one alternation, like
+    patterns with groups, whose numbers and names would clash or shift.
+    """
+
+    def __init__(self, patterns: List[re.Pattern]):
+        """Keep the compiled patterns.
+
+        Args:
+            patterns: Title filter patterns compiled on their own
+        """
+        self._patterns = patterns
+
+    def search(self, title: str) -> bool:
+        """Check whether any pattern matches the start of the title.
+
+        Args:
+            title: Window title to check
+
+        Returns:
+            bool: True if at least one pattern matched
+        """
+        return any(pattern.match(title) for pattern in self._patterns)
+
+def _is_valid_pattern(pattern: str) -> bool:
+    """Check whether a title filter pattern compiles on its own.
+
+    Args:
+        pattern: Regex pattern as entered by the user
+
+    Returns:
+        bool: True if the pattern is valid
+    """
+    try:
+        re.compile(pattern)
+        return True
+    except re.error:
+        return False
+
+def _compile_patterns(patterns: List[str]) -> Union[re.Pattern, _HyperscanMatcher, _PatternList, bool]:
+    """Compile title filter patterns into a single matcher.
+
+    Args:
+        patterns: Regex patterns as entered by the user
+
+    Returns:
+        The matcher, to be used with search(), or False if there are no patterns
+
+    Raises:
+        re.error: If any of the patterns is invalid on its own
+    """
+    if not patterns:
+        return False
+
+    # Compile each pattern on its own first, it validates them
+    compiled = [re.compile(p) for p in patterns]
+    if any(c.groups for c in compiled):
+        # Group numbers, names and backreferences only hold within their own pattern
+        return _PatternList(compiled)
+
+    groups = [_pattern_group(p) for p in patterns]
+    try:
+        combined = re.compile("|".join(groups))
+    except re.error as e:
+        logger.warning("Title patterns cannot be combined, matching them one by one: %s", e)
+        return _PatternList(compiled)
+
+    if hyperscan is not None and len(groups) >= _HYPERSCAN_MIN_PATTERNS:
+        try:
+            return _HyperscanMatcher(groups, combined)
+        except Exception as e:
+            logger.warning("Hyperscan unavailable for title patterns, using re: %s", e)
+    return combined
+
 class ConfigurationManager:
+    __slots__ = (
+        "_app", "_config_path", "_config", "_update_handlers", "_dir_ensured",
+        "_mtime", "_db_path_cached", "_last_validated_parent", "_compiled_patterns"
+    )
+
     def __init__(self, app: 'Application'):
         """Initialize the configuration manager.
         
@@ -22,9 +208,15 @@ class ConfigurationManager:
             "database_path": str(self._get_default_database_path()),
             "polling_interval": 30,  # Default 30 seconds
             "regex_patterns": ["^\\[W\\.A\\.L\\.\\] - .*"],  # Default pattern to ignore our own windows
-            "last_sql_query": ""  # Store the last successful SQL query
+            "last_sql_query": "",  # Store the last successful SQL query
+            "_schema_version": _SCHEMA_VERSION
         }
         self._update_handlers: List[Callable[[], None]] = []
+        self._dir_ensured = False  # Set once the config directory is known to exist
+        self._mtime: float = 0.0  # Modification time of the last loaded/saved file
+        self._db_path_cached: Optional[Path] = None
+        self._last_validated_parent: Optional[str] = None  # Database directory known to exist
+        self._compiled_patterns: Union[re.Pattern, _HyperscanMatcher, _PatternList, bool, None] = None  # False if no patterns
 
     def add_update_handler(self, handler: Callable[[], None]) -> None:
         """Add a handler to be called when configuration is updated.
@@ -50,7 +242,7 @@ class ConfigurationManager:
             try:
                 handler()
             except Exception as e:
-                print(f"Error in configuration update handler: {e}")
+                logger.error("Error in configuration update handler: %s", e)
 
     def load(self) -> bool:
         """Load configuration from file.
@@ -60,12 +252,17 @@ class ConfigurationManager:
         """
         try:
             # Create config directory if it doesn't exist
-            os.makedirs(self._config_path.parent, exist_ok=True)
+            self._ensure_config_dir()
 
             # If config file doesn't exist, create it with default values
             if not self._config_path.exists():
                 return self.save()
 
+            # Skip parsing if the file did not change since it was last read
+            mtime = self._config_path.stat().st_mtime
+            if mtime == self._mtime:
+                return True
+
             # Load existing config
             with open(self._config_path, 'r') as f:
                 loaded_config = json.load(f)
@@ -73,13 +270,15 @@ class ConfigurationManager:
             # Validate and merge with defaults
             if self._validate_loaded_config(loaded_config):
                 self._config.update(loaded_config)
+                self._mtime = mtime
+                self._invalidate_caches()
                 return True
 
-            print(f"Invalid configuration found in {self._config_path}, using defaults")
+            logger.warning("Invalid configuration found in %s, using defaults", self._config_path)
             return self.save()  # Save defaults if loaded config is invalid
 
         except Exception as e:
-            print(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             return False
 
     def save(self) -> bool:
@@ -90,23 +289,48 @@ class ConfigurationManager:
         """
         try:
             # Create config directory if it doesn't exist
-            os.makedirs(self._config_path.parent, exist_ok=True)
-
-            # Save config with pretty printing
-            with open(self._config_path, 'w') as f:
-                json.dump(self._config, f, indent=4)
+            self._ensure_config_dir()
+
+            # Save config with pretty printing, through a temporary file so a
+            # failed write never leaves a truncated config behind
+            if orjson is not None:
+                data = orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._config, indent=4).encode("utf-8")
+            tmp_path = self._config_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self._config_path)
+            self._mtime = self._config_path.stat().st_mtime
 
             # Notify handlers of update
             self._notify_update()
             return True
 
         except Exception as e:
-            print(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
             return False
 
+    def _ensure_config_dir(self) -> None:
+        """Create the configuration directory once per process."""
+        if not self._dir_ensured:
+            os.makedirs(self._config_path.parent, exist_ok=True)
+            self._dir_ensured = True
+
+    def _invalidate_caches(self) -> None:
+        """Drop values derived from the configuration dictionary."""
+        self._db_path_cached = None
+        self._last_validated_parent = None
+        self._compiled_patterns = None
+
     def get_database_path(self) -> Path:
         """Get the configured database path."""
-        return Path(self._config["database_path"])
+        if self._db_path_cached is None:
+            self._db_path_cached = Path(self._config["database_path"])
+        return self._db_path_cached
+
+    def get_database_path_str(self) -> str:
+        """Get the configured database path as stored in the configuration."""
+        return self._config["database_path"]
 
     def set_database_path(self, path: Path) -> None:
         """Set the database path in configuration.
@@ -115,6 +339,8 @@ class ConfigurationManager:
             path: New database path
         """
         self._config["database_path"] = str(path)
+        self._db_path_cached = None
+        self._last_validated_parent = None
 
     def get_polling_interval(self) -> int:
         """Get the configured polling interval in seconds."""
@@ -139,8 +365,34 @@ class ConfigurationManager:
 
         Args:
             patterns: List of regex patterns for title filtering
+
+        Raises:
+            re.error: If a pattern is invalid, the configuration is left unchanged
         """
+        compiled = _compile_patterns(patterns)  # Compile first so invalid patterns are never stored
         self._config["regex_patterns"] = patterns
+        self._compiled_patterns = compiled
+
+    def get_compiled_patterns(self) -> Union[re.Pattern, _HyperscanMatcher, _PatternList, None]:
+        """Get the title filter patterns combined into one compiled regex.
+
+        The combined pattern must be used with search(), each pattern keeps
+        the start anchoring it had with re.match. Large pattern sets use
+        Hyperscan when it is installed and supports every pattern, patterns
+        that cannot be combined are matched one by one.
+
+        Returns:
+            The combined pattern, or None if no patterns are configured
+        """
+        if self._compiled_patterns is None:
+            patterns = self._config["regex_patterns"]
+            try:
+                self._compiled_patterns = _compile_patterns(patterns)
+            except re.error as e:
+                # Stored by hand or by an earlier version, filter with the valid ones
+                logger.error("Ignoring invalid title filter patterns: %s", e)
+                self._compiled_patterns = _compile_patterns([p for p in patterns if _is_valid_pattern(p)])
+        return self._compiled_patterns or None
 
     def get_last_sql_query(self) -> str:
         """Get the last successful SQL query."""
@@ -161,10 +413,12 @@ class ConfigurationManager:
             bool: True if configuration is valid, False otherwise
         """
         try:
-            # Validate database path
-            db_path = Path(self._config["database_path"])
-            if not db_path.parent.exists():
-                return False
+            # Validate database path, the directory is only checked once per path
+            parent = str(self.get_database_path().parent)
+            if parent != self._last_validated_parent:
+                if not os.path.isdir(parent):
+                    return False
+                self._last_validated_parent = parent
 
             # Validate polling interval
             if not isinstance(self._config["polling_interval"], int) or self._config["polling_interval"] < 1:
@@ -189,7 +443,7 @@ class ConfigurationManager:
         Returns:
             Path to config.json in the WindowLogger directory under user's Documents
         """
-        return Path(os.path.expandvars("%USERPROFILE%")) / "Documents" / "WindowLogger" / "config.json"
+        return _CONFIG_PATH
 
     def _get_default_database_path(self) -> Path:
         """Get the default path for the database file.
@@ -197,7 +451,7 @@ class ConfigurationManager:
         Returns:
             Path to activity.db in the WindowLogger directory under user's Documents
         """
-        return Path(os.path.expandvars("%USERPROFILE%")) / "Documents" / "WindowLogger" / "activity.db"
+        return _DEFAULT_DB
 
     def _validate_loaded_config(self, config: Dict[str, Any]) -> bool:
         """Validate loaded configuration data.
@@ -214,6 +468,8 @@ class ConfigurationManager:
         if not all(key in config for key in required_keys):
             return False
 
+        # Check the types even for files written by this version, they may have
+        # been edited by hand. Patterns are compiled later, invalid ones are skipped.
         try:
             # Validate database path
             db_path = Path(config["database_path"])
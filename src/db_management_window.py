@@ -3,16 +3,30 @@ Database management window for editing database entries.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from typing import Optional, Dict, List, Set, Any, Callable
-import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, List, Set, Tuple, Any, Callable, TYPE_CHECKING
+import logging
 
-from db_manager import DatabaseManager
+if TYPE_CHECKING:
+    from db_manager import DatabaseManager
 
 
+logger = logging.getLogger(__name__)
+
 class DatabaseManagementWindow:
     """Window for managing database entries like projects and window titles."""
 
-    def __init__(self, parent, db_manager: DatabaseManager):
+    # Number of titles inserted into the tree per event loop iteration
+    _TITLES_CHUNK_SIZE = 200
+    # Delays before refreshing the titles after the search text or project filter changed
+    _SEARCH_DELAY_MS = 150
+    _FILTER_DELAY_MS = 50
+    # Shortest search term that is applied, shorter ones do not filter the list
+    _MIN_SEARCH_LENGTH = 3
+    # Appended to shown values that only change once the staged edits are applied
+    _PENDING_MARKER = " *"
+
+    def __init__(self, parent, db_manager: 'DatabaseManager'):
         """Initialize the database management window.
 
         Args:
@@ -22,11 +36,42 @@ class DatabaseManagementWindow:
         self._parent = parent
         self._db_manager = db_manager
         self._window: Optional[tk.Toplevel] = None
+        self._visible = False  # The window is withdrawn instead of destroyed when closed
         
-        # UI elements
+        # UI elements, tab contents are built when a tab is first shown
+        self._notebook: Optional[ttk.Notebook] = None
+        self._tab_builders: Dict[str, Callable[[ttk.Frame], None]] = {}
+        self._built_tabs: Set[str] = set()
         self._projects_tree: Optional[ttk.Treeview] = None
+        self._project_titles_list: Optional[tk.Listbox] = None
         self._titles_tree: Optional[ttk.Treeview] = None
+        self._search_var: Optional[tk.StringVar] = None
+        self._filter_project_var: Optional[tk.StringVar] = None
+        self._filter_project_combo: Optional[ttk.Combobox] = None
+        self._titles_fill_job: Optional[str] = None  # Pending chunked tree fill
+        self._search_after_id: Optional[str] = None  # Pending debounced titles refresh
+        self._titles_state: Optional[tuple] = None  # Search, project filter and revision of the shown titles
+        # Titles queries run here so a slow query does not block the window
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DatabaseReader")
+        self._titles_future: Optional[Future] = None  # Titles query whose result is awaited
+
+        # Reassignments and renames wait here until applied in one transaction
+        self._pending_edits: List[Tuple[str, tuple]] = []
+        self._staged_names: Dict[int, str] = {}  # Staged project renames, by project ID
+        self._staged_projects: Dict[int, int] = {}  # Staged project of reassigned titles, by title ID
+        self._pending_label: Optional[ttk.Label] = None
+        self._apply_btn: Optional[ttk.Button] = None
+        self._discard_btn: Optional[ttk.Button] = None
+
+        # Query results keyed by name, stored with the database revision and arguments they were read with
+        self._cache: Dict[str, Tuple[int, tuple, Any]] = {}
+        self._shown_revision: Optional[int] = None
+        # Values currently displayed in each treeview, by item ID
+        self._project_rows: Dict[str, tuple] = {}
+        self._title_rows: Dict[str, tuple] = {}
+        self._shown_titles: Optional[List[Dict[str, Any]]] = None  # Titles the treeview is filled from
         self._projects_dict: Dict[int, str] = {}  # ID -> name
+        self._projects_by_name: Dict[str, int] = {}  # name -> ID
         self._selected_project_id: Optional[int] = None
         self._selected_title_ids: Set[int] = set()
 
@@ -34,76 +79,134 @@ class DatabaseManagementWindow:
         """Show the database management window."""
         # If window already exists, bring it to front
         if self._window is not None:
+            self._visible = True
             self._window.deiconify()
             self._window.lift()
-            self._refresh_data()
+            self._refresh_if_stale()
             return
 
+        self._visible = True
+
         # Create window
         self._window = tk.Toplevel()
         self._window.title("[W.A.L.] - Database Management")
         self._window.minsize(800, 600)
         self._window.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Create UI
+        # Create UI, data is loaded when the first tab gets built
         self._create_ui()
-        self._refresh_data()
 
     def _create_ui(self) -> None:
         """Create the user interface."""
+        self._window.columnconfigure(0, weight=1)
+        self._window.rowconfigure(0, weight=1)
+
         # Create a notebook (tabs)
         notebook = ttk.Notebook(self._window)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._notebook = notebook
 
         # Projects tab
         projects_frame = ttk.Frame(notebook)
         notebook.add(projects_frame, text="Projects")
-        self._create_projects_tab(projects_frame)
 
         # Window Titles tab
         titles_frame = ttk.Frame(notebook)
         notebook.add(titles_frame, text="Window Titles")
-        self._create_titles_tab(titles_frame)
+
+        # Pending edits bar
+        edits_frame = ttk.Frame(self._window)
+        edits_frame.columnconfigure(0, weight=1)
+        self._pending_label = ttk.Label(edits_frame)
+        self._apply_btn = ttk.Button(edits_frame, text="Apply", command=self._on_apply_edits)
+        self._discard_btn = ttk.Button(edits_frame, text="Discard", command=self._on_discard_edits)
+        self._update_pending_edits()
+
+        # Place everything in one pass
+        notebook.grid(row=0, column=0, sticky=tk.NSEW, padx=10, pady=10)
+        edits_frame.grid(row=1, column=0, sticky=tk.EW, padx=10, pady=(0, 10))
+        self._pending_label.grid(row=0, column=0, sticky=tk.E, padx=5)
+        self._apply_btn.grid(row=0, column=1, padx=5)
+        self._discard_btn.grid(row=0, column=2, padx=(5, 0))
+
+        # Tab contents are only created once the tab is selected
+        self._tab_builders = {
+            str(projects_frame): self._create_projects_tab,
+            str(titles_frame): self._create_titles_tab
+        }
+        self._built_tabs = set()
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._window.after_idle(self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Build the contents of the selected tab if it has not been built yet."""
+        if not self._notebook:
+            return
+        tab_id = self._notebook.select()
+        if not tab_id or tab_id in self._built_tabs:
+            return
+
+        self._built_tabs.add(tab_id)
+        self._tab_builders[tab_id](self._notebook.nametowidget(tab_id))
+
+    def _create_tab_header(self, parent: ttk.Frame, text: str, content_row: int) -> ttk.Label:
+        """Lay out a tab grid and create its header and loading placeholder.
+
+        Args:
+            parent: Parent frame for the tab
+            text: Header text
+            content_row: Grid row that takes up the remaining space
+
+        Returns:
+            The placeholder label shown in the content row
+        """
+        # The tab is sized by the notebook, its contents do not need to resize it
+        parent.grid_propagate(False)
+        parent.columnconfigure(0, weight=1)
+        parent.rowconfigure(content_row, weight=1)
+
+        header_label = ttk.Label(parent, text=text, font=("", 12, "bold"))
+        placeholder = ttk.Label(parent, text="Loading...")
+
+        header_label.grid(row=0, column=0, sticky=tk.W, padx=5, pady=(10, 5))
+        placeholder.grid(row=content_row, column=0, sticky=tk.N, padx=5, pady=5)
+        return placeholder
 
     def _create_projects_tab(self, parent: ttk.Frame) -> None:
-        """Create the projects management tab.
+        """Create the projects management tab header, the rest follows once it is drawn.
         
         Args:
             parent: Parent frame for this tab
         """
-        # Top frame for label and buttons
-        top_frame = ttk.Frame(parent)
-        top_frame.pack(fill=tk.X, pady=(10, 5))
-        
-        # Label
-        header_label = ttk.Label(top_frame, text="Manage Projects", font=("", 12, "bold"))
-        header_label.pack(side=tk.LEFT, padx=5)
+        placeholder = self._create_tab_header(parent, "Manage Projects", 1)
+        parent.after_idle(self._create_projects_tab_body, parent, placeholder)
+
+    def _create_projects_tab_body(self, parent: ttk.Frame, placeholder: ttk.Label) -> None:
+        """Create the project list and details of the projects tab.
         
-        # Bottom frame split into project list and details
+        Args:
+            parent: Parent frame for this tab
+            placeholder: Loading label to remove once the contents exist
+        """
+        # Main frame split into project list (left) and details (right)
         main_frame = ttk.Frame(parent)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Project list frame (left)
+        main_frame.columnconfigure((0, 1), weight=1)
+        main_frame.rowconfigure(0, weight=1)
+
         list_frame = ttk.LabelFrame(main_frame, text="Projects")
-        list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # Create treeview with scrollbar
-        tree_frame = ttk.Frame(list_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        list_frame.columnconfigure(0, weight=1)
+        list_frame.rowconfigure(0, weight=1)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Projects treeview
+        # Projects treeview with scrollbar
+        scrollbar = ttk.Scrollbar(list_frame)
         columns = ("id", "name", "titles")
         self._projects_tree = ttk.Treeview(
-            tree_frame, 
+            list_frame, 
             columns=columns, 
             show="headings",
             selectmode="browse",
             yscrollcommand=scrollbar.set
         )
+        scrollbar.config(command=self._projects_tree.yview)
         
         # Configure columns
         self._projects_tree.heading("id", text="ID")
@@ -114,106 +217,87 @@ class DatabaseManagementWindow:
         self._projects_tree.column("name", width=200)
         self._projects_tree.column("titles", width=80, anchor=tk.CENTER)
         
-        self._projects_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self._projects_tree.yview)
-        
         # Bind select event
         self._projects_tree.bind("<<TreeviewSelect>>", self._on_project_selected)
         
-        # Buttons frame
+        # Buttons
         btn_frame = ttk.Frame(list_frame)
-        btn_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Add button
         add_btn = ttk.Button(btn_frame, text="Add Project", command=self._on_add_project)
-        add_btn.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Rename button
         rename_btn = ttk.Button(btn_frame, text="Rename", command=self._on_rename_project)
-        rename_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Delete button
         delete_btn = ttk.Button(btn_frame, text="Delete", command=self._on_delete_project)
-        delete_btn.pack(side=tk.LEFT, padx=5)
         
-        # Project details frame (right)
+        # Project titles list with scrollbar
         details_frame = ttk.LabelFrame(main_frame, text="Project Titles")
-        details_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # Create treeview for titles
-        titles_frame = ttk.Frame(details_frame)
-        titles_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Scrollbar
-        titles_scrollbar = ttk.Scrollbar(titles_frame)
-        titles_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Titles list
+        details_frame.columnconfigure(0, weight=1)
+        details_frame.rowconfigure(0, weight=1)
+
+        titles_scrollbar = ttk.Scrollbar(details_frame)
         self._project_titles_list = tk.Listbox(
-            titles_frame,
+            details_frame,
             yscrollcommand=titles_scrollbar.set
         )
-        self._project_titles_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         titles_scrollbar.config(command=self._project_titles_list.yview)
 
+        # Place everything in one pass
+        self._projects_tree.grid(row=0, column=0, sticky=tk.NSEW, padx=(5, 0), pady=5)
+        scrollbar.grid(row=0, column=1, sticky=tk.NS, padx=(0, 5), pady=5)
+        btn_frame.grid(row=1, column=0, columnspan=2, sticky=tk.EW, padx=5, pady=5)
+        add_btn.grid(row=0, column=0, padx=(0, 5))
+        rename_btn.grid(row=0, column=1, padx=5)
+        delete_btn.grid(row=0, column=2, padx=5)
+        self._project_titles_list.grid(row=0, column=0, sticky=tk.NSEW, padx=(5, 0), pady=5)
+        titles_scrollbar.grid(row=0, column=1, sticky=tk.NS, padx=(0, 5), pady=5)
+        list_frame.grid(row=0, column=0, sticky=tk.NSEW, padx=(0, 5))
+        details_frame.grid(row=0, column=1, sticky=tk.NSEW, padx=(5, 0))
+
+        placeholder.destroy()
+        main_frame.grid(row=1, column=0, sticky=tk.NSEW, padx=5, pady=5)
+        self._refresh_data()
+
     def _create_titles_tab(self, parent: ttk.Frame) -> None:
-        """Create the window titles management tab.
+        """Create the window titles management tab header, the rest follows once it is drawn.
         
         Args:
             parent: Parent frame for this tab
         """
-        # Top frame for label and buttons
-        top_frame = ttk.Frame(parent)
-        top_frame.pack(fill=tk.X, pady=(10, 5))
-        
-        # Label
-        header_label = ttk.Label(top_frame, text="Manage Window Titles", font=("", 12, "bold"))
-        header_label.pack(side=tk.LEFT, padx=5)
+        placeholder = self._create_tab_header(parent, "Manage Window Titles", 2)
+        parent.after_idle(self._create_titles_tab_body, parent, placeholder)
+
+    def _create_titles_tab_body(self, parent: ttk.Frame, placeholder: ttk.Label) -> None:
+        """Create the search bar, title list and buttons of the titles tab.
         
-        # Search frame
+        Args:
+            parent: Parent frame for this tab
+            placeholder: Loading label to remove once the contents exist
+        """
+        # Search bar
         search_frame = ttk.Frame(parent)
-        search_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Search label
         search_label = ttk.Label(search_frame, text="Search:")
-        search_label.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Search entry
         self._search_var = tk.StringVar()
         self._search_var.trace_add("write", self._on_search_changed)
         search_entry = ttk.Entry(search_frame, textvariable=self._search_var, width=40)
-        search_entry.pack(side=tk.LEFT, padx=5)
         
         # Project filter
         filter_label = ttk.Label(search_frame, text="Project:")
-        filter_label.pack(side=tk.LEFT, padx=(15, 5))
-        
         self._filter_project_var = tk.StringVar()
         self._filter_project_var.trace_add("write", self._on_project_filter_changed)
         self._filter_project_combo = ttk.Combobox(search_frame, textvariable=self._filter_project_var, state="readonly")
-        self._filter_project_combo.pack(side=tk.LEFT, padx=5)
         
-        # Main frame
+        # Main frame with the titles treeview and its scrollbar
         main_frame = ttk.Frame(parent)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Create treeview with scrollbar
-        tree_frame = ttk.Frame(main_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=(0, 5))
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Titles treeview
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+
+        scrollbar = ttk.Scrollbar(main_frame)
         columns = ("id", "title", "project", "logs", "first_seen", "last_seen")
         self._titles_tree = ttk.Treeview(
-            tree_frame, 
+            main_frame, 
             columns=columns, 
             show="headings",
             selectmode="extended",
             yscrollcommand=scrollbar.set
         )
+        scrollbar.config(command=self._titles_tree.yview)
         
         # Configure columns
         self._titles_tree.heading("id", text="ID")
@@ -230,65 +314,160 @@ class DatabaseManagementWindow:
         self._titles_tree.column("first_seen", width=120, anchor=tk.CENTER)
         self._titles_tree.column("last_seen", width=120, anchor=tk.CENTER)
         
-        self._titles_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self._titles_tree.yview)
-        
         # Bind select event
         self._titles_tree.bind("<<TreeviewSelect>>", self._on_title_selected)
         
-        # Button frame
+        # Buttons, Refresh is kept apart on the right
         btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill=tk.X)
-        
-        # Delete button
+        btn_frame.columnconfigure(3, weight=1)
         delete_btn = ttk.Button(btn_frame, text="Delete Selected", command=self._on_delete_titles)
-        delete_btn.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Reassign button
         reassign_btn = ttk.Button(btn_frame, text="Reassign to Project", command=self._on_reassign_titles)
-        reassign_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Merge button
         merge_btn = ttk.Button(btn_frame, text="Merge Selected", command=self._on_merge_titles)
-        merge_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Refresh button
-        refresh_btn = ttk.Button(btn_frame, text="Refresh", command=self._refresh_data)
-        refresh_btn.pack(side=tk.RIGHT, padx=5)
+        refresh_btn = ttk.Button(btn_frame, text="Refresh", command=self._on_refresh)
+
+        # Place everything in one pass
+        search_label.grid(row=0, column=0, padx=(0, 5))
+        search_entry.grid(row=0, column=1, padx=5)
+        filter_label.grid(row=0, column=2, padx=(15, 5))
+        self._filter_project_combo.grid(row=0, column=3, padx=5)
+        self._titles_tree.grid(row=0, column=0, sticky=tk.NSEW, pady=(0, 5))
+        scrollbar.grid(row=0, column=1, sticky=tk.NS, pady=(0, 5))
+        btn_frame.grid(row=1, column=0, columnspan=2, sticky=tk.EW)
+        delete_btn.grid(row=0, column=0, padx=(0, 5))
+        reassign_btn.grid(row=0, column=1, padx=5)
+        merge_btn.grid(row=0, column=2, padx=5)
+        refresh_btn.grid(row=0, column=4, padx=5)
+
+        placeholder.destroy()
+        search_frame.grid(row=1, column=0, sticky=tk.EW, padx=5, pady=5)
+        main_frame.grid(row=2, column=0, sticky=tk.NSEW, padx=5, pady=5)
+        self._refresh_data()
 
     def _refresh_data(self) -> None:
         """Refresh all data from the database."""
+        if not self._visible:
+            self._shown_revision = None  # Refresh once shown again
+            return
+        self._shown_revision = self._db_manager.revision
         self._refresh_projects()
         self._refresh_titles()
 
+    def _refresh_if_stale(self) -> None:
+        """Refresh the data only if the database changed since it was last shown."""
+        if self._shown_revision != self._db_manager.revision:
+            self._refresh_data()
+
+    def _on_refresh(self) -> None:
+        """Reload all data, including changes made by other programs."""
+        self._cache.clear()
+        self._titles_state = None
+        self._refresh_data()
+
+    def _cached(self, key: str, loader: Callable[..., Any], *args: Any) -> Any:
+        """Get a query result, reusing the cached one if the database and arguments did not change.
+
+        Args:
+            key: Name of the cached result
+            loader: Function running the query
+            *args: Arguments for the loader
+
+        Returns:
+            The query result
+        """
+        revision = self._db_manager.revision
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == revision and cached[1] == args:
+            return cached[2]
+        result = loader(*args)
+        self._cache[key] = (revision, args, result)
+        return result
+
+    def _carry_over_cache(self, revision: int, *keys: str) -> bool:
+        """Keep cached results valid across a write made from this window that did not affect them.
+
+        Args:
+            revision: Database revision read right before the write
+            *keys: Names of the cached results the write left unchanged
+
+        Returns:
+            bool: True if the shown data only lacks that write, False if it must be reloaded
+        """
+        current = self._db_manager.revision
+        if self._shown_revision != revision or current != revision + 1:
+            return False  # Other changes happened as well
+        for key in keys:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == revision:
+                self._cache[key] = (current, cached[1], cached[2])
+        self._shown_revision = current
+        return True
+
+    def _remove_stale_rows(self, tree: ttk.Treeview, shown: Dict[str, tuple], keep: Set[str]) -> None:
+        """Delete treeview items that are not part of the new rows.
+
+        Args:
+            tree: Treeview to update
+            shown: Values currently displayed, by item ID
+            keep: Item IDs of the new rows
+        """
+        stale = [iid for iid in shown if iid not in keep]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del shown[iid]
+
+    def _apply_rows(self, tree: ttk.Treeview, shown: Dict[str, tuple],
+                    rows: List[Tuple[str, tuple]], offset: int, reorder: bool) -> None:
+        """Insert or update treeview items so they match the given rows.
+
+        Only new items are inserted and only changed values are written.
+
+        Args:
+            tree: Treeview to update
+            shown: Values currently displayed, by item ID
+            rows: Item ID and values of consecutive rows, in display order
+            offset: Display position of the first of the rows
+            reorder: Whether existing items may have to move, because their sort key can change
+        """
+        # Bind the methods once, this loop runs for every row of the tree
+        insert, item, move, get = tree.insert, tree.item, tree.move, shown.get
+        for index, (iid, values) in enumerate(rows, offset):
+            old = get(iid)
+            if old is None:
+                insert("", index, iid=iid, values=values)
+            else:
+                if old != values:
+                    item(iid, values=values)
+                if reorder:
+                    move(iid, "", index)
+            shown[iid] = values
+
     def _refresh_projects(self) -> None:
         """Refresh projects data."""
         # Get projects from database
-        self._projects_dict = self._db_manager.get_projects()
+        self._projects_dict = self._cached("projects", self._db_manager.get_projects)
+        self._projects_by_name = {name: project_id for project_id, name in self._projects_dict.items()}
         
         # Update projects treeview
         if self._projects_tree:
-            # Clear existing items
-            for item in self._projects_tree.get_children():
-                self._projects_tree.delete(item)
-            
             # Get titles count by project
-            titles_by_project = {}
-            all_titles = self._db_manager.get_all_titles()
+            titles_by_project = self._cached("title_counts", self._db_manager.get_title_counts_by_project)
             
-            for title in all_titles:
-                project_id = title['project_id']
-                titles_by_project[project_id] = titles_by_project.get(project_id, 0) + 1
-            
-            # Add projects to treeview
-            for project_id, project_name in self._projects_dict.items():
-                title_count = titles_by_project.get(project_id, 0)
-                self._projects_tree.insert(
-                    "", 
-                    tk.END, 
-                    iid=str(project_id),
-                    values=(project_id, project_name, title_count)
+            # Apply the differences to the treeview, renames can change the order
+            staged_names = self._staged_names
+            rows = [
+                (
+                    str(project_id),
+                    (
+                        project_id,
+                        staged_names[project_id] + self._PENDING_MARKER if project_id in staged_names else project_name,
+                        titles_by_project.get(project_id, 0)
+                    )
                 )
+                for project_id, project_name in self._projects_dict.items()
+            ]
+            self._remove_stale_rows(self._projects_tree, self._project_rows, {iid for iid, _ in rows})
+            self._apply_rows(self._projects_tree, self._project_rows, rows, 0, True)
         
         # Update project filter combobox for titles tab
         if self._filter_project_combo:
@@ -301,52 +480,139 @@ class DatabaseManagementWindow:
         """Refresh titles data."""
         if not self._titles_tree:
             return
+        if not self._visible:
+            self._shown_revision = None  # Refresh once shown again
+            return
+
+        # Very short search terms match most titles, list them as if nothing was typed
+        search_term = self._search_var.get() if self._search_var else ""
+        if len(search_term) < self._MIN_SEARCH_LENGTH:
+            search_term = ""
+
+        # Nothing to do if the same titles are already shown or being filled in
+        project_filter = self._filter_project_var.get() if self._filter_project_var else "All Projects"
+        state = (search_term, project_filter, self._db_manager.revision)
+        if state == self._titles_state:
+            return
+        self._titles_state = state
             
-        # Clear existing items
-        for item in self._titles_tree.get_children():
-            self._titles_tree.delete(item)
-        
-        # Get all titles from database
-        titles = self._db_manager.get_all_titles()
-        
-        # Apply search filter if any
-        search_term = self._search_var.get().lower() if hasattr(self, "_search_var") else ""
-        if search_term:
-            titles = [t for t in titles if search_term in t['title'].lower()]
-        
-        # Apply project filter if any
-        project_filter = self._filter_project_var.get() if hasattr(self, "_filter_project_var") else "All Projects"
-        if project_filter != "All Projects":
-            # Find project ID by name
-            project_id = None
-            for pid, pname in self._projects_dict.items():
-                if pname == project_filter:
-                    project_id = pid
-                    break
-            
-            if project_id is not None:
-                titles = [t for t in titles if t['project_id'] == project_id]
+        # Stop filling in the previous result
+        if self._titles_fill_job:
+            self._titles_tree.after_cancel(self._titles_fill_job)
+            self._titles_fill_job = None
         
-        # Add titles to treeview
-        for title in titles:
-            # Format timestamps
-            first_seen = self._format_timestamp(title['first_seen'])
-            last_seen = self._format_timestamp(title['last_seen'])
-            
-            self._titles_tree.insert(
-                "", 
-                tk.END, 
-                iid=str(title['id']),
-                values=(
-                    title['id'], 
-                    title['title'], 
-                    title['project_name'], 
+        # Resolve the project filter to its ID
+        project_id = self._projects_by_name.get(project_filter) if project_filter != "All Projects" else None
+
+        # Get matching titles from the cache or, in the background, from the database
+        if search_term or project_id is not None:
+            key, loader, args = "filtered_titles", self._db_manager.get_titles, (search_term or None, project_id)
+        else:
+            key, loader, args = "titles", self._db_manager.get_all_titles, ()
+
+        if self._titles_future:
+            self._titles_future.cancel()
+            self._titles_future = None
+
+        revision = self._db_manager.revision
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == revision and cached[1] == args:
+            self._show_titles(cached[2])
+            return
+
+        future = self._io.submit(loader, *args)
+        self._titles_future = future
+        tree = self._titles_tree
+        future.add_done_callback(
+            lambda done: tree.after(0, self._on_titles_loaded, done, key, revision, args)
+        )
+
+    def _on_titles_loaded(self, future: Future, key: str, revision: int, args: tuple) -> None:
+        """Cache and show titles read by the background query, in the UI thread.
+
+        Args:
+            future: The finished query
+            key: Name the result is cached under
+            revision: Database revision read before the query started
+            args: Arguments of the query
+        """
+        if future is not self._titles_future or future.cancelled():
+            return  # A newer query replaced this one
+        self._titles_future = None
+        try:
+            titles = future.result()
+        except Exception as e:
+            logger.error("Error loading titles: %s", e)
+            self._titles_state = None  # Let the next refresh try again
+            return
+        self._cache[key] = (revision, args, titles)
+        if not self._visible:
+            self._titles_state = None  # Show them from the cache once shown again
+            self._shown_revision = None
+        elif self._titles_tree:
+            self._show_titles(titles)
+
+    def _show_titles(self, titles: List[Dict[str, Any]]) -> None:
+        """Start showing the given titles in the titles treeview.
+
+        Args:
+            titles: Every title to show, in display order
+        """
+        # Apply the differences to the treeview in chunks so large lists keep the
+        # window responsive, a title never changes so its position stays sorted
+        self._shown_titles = titles
+        self._remove_stale_rows(self._titles_tree, self._title_rows, {str(title['id']) for title in titles})
+        self._apply_title_rows(titles, 0)
+
+    def _apply_title_rows(self, titles: List[Dict[str, Any]], start: int) -> None:
+        """Apply one chunk of titles to the treeview and schedule the next.
+
+        Rows are only formatted when their chunk is applied, so the first rows
+        appear without waiting for the whole result to be prepared.
+
+        Args:
+            titles: Every title to show, in display order
+            start: Index of the first title of this chunk
+        """
+        self._titles_fill_job = None
+        if not self._titles_tree:
+            return
+
+        end = start + self._TITLES_CHUNK_SIZE
+        rows = [
+            (
+                str(title['id']),
+                (
+                    title['id'],
+                    title['title'],
+                    self._title_project_text(title),
                     title['log_count'],
-                    first_seen,
-                    last_seen
+                    title['first_seen_text'],
+                    title['last_seen_text']
                 )
             )
+            for title in titles[start:end]
+        ]
+        self._apply_rows(self._titles_tree, self._title_rows, rows, start, False)
+        if end < len(titles):
+            self._titles_fill_job = self._titles_tree.after(1, self._apply_title_rows, titles, end)
     
+    def _title_project_text(self, title: Dict[str, Any]) -> str:
+        """Get the project shown for a title, as it will be once the staged edits are applied.
+
+        Args:
+            title: Title as returned by the database manager
+
+        Returns:
+            The project name, marked if a staged edit changes it
+        """
+        project_id = self._staged_projects.get(title['id'], title['project_id'])
+        if project_id in self._staged_names:
+            return self._staged_names[project_id] + self._PENDING_MARKER
+        if project_id != title['project_id']:
+            return self._projects_dict.get(project_id, "") + self._PENDING_MARKER
+        return title['project_name']
+
     def _refresh_project_titles(self) -> None:
         """Refresh the titles list for the selected project."""
         # Clear the list
@@ -354,35 +620,17 @@ class DatabaseManagementWindow:
             self._project_titles_list.delete(0, tk.END)
             
             if self._selected_project_id is not None:
-                # Get titles for this project
-                titles = self._db_manager.get_titles_by_project(self._selected_project_id)
-                
-                # Add to listbox
-                for title in titles:
-                    self._project_titles_list.insert(tk.END, title['title'])
-
-    def _format_timestamp(self, timestamp: str) -> str:
-        """Format a timestamp string for display.
-        
-        Args:
-            timestamp: The timestamp to format
-            
-        Returns:
-            Formatted timestamp string
-        """
-        if not timestamp:
-            return ""
-            
-        try:
-            if isinstance(timestamp, str):
-                dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            else:
-                dt = timestamp
+                # Get titles for this project, each project is cached on its own
+                # so switching back and forth between projects reads them once
+                titles = self._cached(
+                    f"project_titles:{self._selected_project_id}",
+                    self._db_manager.get_titles_by_project,
+                    self._selected_project_id
+                )
                 
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except Exception as e:
-            print(f"Error formatting timestamp: {e}")
-            return str(timestamp)
+                # Add to listbox in a single call
+                if titles:
+                    self._project_titles_list.insert(tk.END, *[title['title'] for title in titles])
 
     def _on_project_selected(self, event) -> None:
         """Handle project selection in treeview."""
@@ -402,12 +650,29 @@ class DatabaseManagementWindow:
 
     def _on_search_changed(self, *args) -> None:
         """Handle search entry changes."""
-        # Refresh titles with new search term
-        self._refresh_titles()
+        # Refresh titles with new search term once typing pauses
+        self._schedule_titles_refresh(self._SEARCH_DELAY_MS)
 
     def _on_project_filter_changed(self, *args) -> None:
         """Handle project filter changes."""
         # Refresh titles with new filter
+        self._schedule_titles_refresh(self._FILTER_DELAY_MS)
+
+    def _schedule_titles_refresh(self, delay_ms: int) -> None:
+        """Refresh the titles after a delay, replacing any refresh already scheduled.
+
+        Args:
+            delay_ms: Delay in milliseconds
+        """
+        if not self._window:
+            return
+        if self._search_after_id:
+            self._window.after_cancel(self._search_after_id)
+        self._search_after_id = self._window.after(delay_ms, self._run_scheduled_titles_refresh)
+
+    def _run_scheduled_titles_refresh(self) -> None:
+        """Run the titles refresh scheduled by _schedule_titles_refresh."""
+        self._search_after_id = None
         self._refresh_titles()
 
     def _on_add_project(self) -> None:
@@ -420,12 +685,26 @@ class DatabaseManagementWindow:
         )
         
         if project_name:
+            # A staged rename to the same name would fail once the edits are applied
+            if any(operation == "rename_project" and params[0] == project_name
+                   for operation, params in self._pending_edits):
+                messagebox.showerror(
+                    "[W.A.L.] - Error",
+                    "A pending rename already uses this project name.",
+                    parent=self._window
+                )
+                return
+
             # Create project in database
+            revision = self._db_manager.revision
             project_id = self._db_manager.create_project(project_name)
             
             if project_id:
-                # Refresh data
-                self._refresh_data()
+                # A new project has no titles, only the projects list changes
+                if self._carry_over_cache(revision, "titles", "filtered_titles", "title_counts"):
+                    self._refresh_projects()
+                else:
+                    self._refresh_data()
                 
                 # Select the new project
                 if self._projects_tree:
@@ -469,18 +748,18 @@ class DatabaseManagementWindow:
         )
         
         if new_name and new_name != current_name:
-            # Rename in database
-            success = self._db_manager.rename_project(self._selected_project_id, new_name)
-            
-            if success:
-                # Refresh data
-                self._refresh_data()
-            else:
+            pending_names = {params[0] for operation, params in self._pending_edits if operation == "rename_project"}
+            if new_name in self._projects_dict.values() or new_name in pending_names:
                 messagebox.showerror(
                     "[W.A.L.] - Error",
-                    "Failed to rename project. The name may already exist.",
+                    "A project with this name already exists.",
                     parent=self._window
                 )
+                return
+
+            # Stage the rename, it is written when the edits are applied
+            self._pending_edits.append(("rename_project", (new_name, self._selected_project_id)))
+            self._update_pending_edits()
 
     def _on_delete_project(self) -> None:
         """Delete the selected project."""
@@ -521,6 +800,15 @@ class DatabaseManagementWindow:
         success = self._db_manager.delete_project(self._selected_project_id, not result)
         
         if success:
+            # Staged edits must not bring the deleted project back into use
+            deleted_id = self._selected_project_id
+            self._pending_edits = [
+                (operation, params) for operation, params in self._pending_edits
+                if not (operation == "assign_project" and params[0] == deleted_id)
+                and not (operation == "rename_project" and params[1] == deleted_id)
+            ]
+            self._update_pending_edits()
+
             # Refresh data
             self._refresh_data()
             
@@ -555,11 +843,9 @@ class DatabaseManagementWindow:
         if not result:
             return
             
-        # Delete each title
-        success_count = 0
-        for title_id in self._selected_title_ids:
-            if self._db_manager.delete_title(title_id):
-                success_count += 1
+        # Delete all selected titles in one transaction
+        revision = self._db_manager.revision
+        success_count = self._db_manager.delete_titles(list(self._selected_title_ids))
                 
         # Report results
         if success_count == count:
@@ -575,12 +861,54 @@ class DatabaseManagementWindow:
                 parent=self._window
             )
             
-        # Refresh data
-        self._refresh_data()
+        # Remove just the deleted rows, unless the list is still being filled in
+        if (success_count == count and not self._titles_fill_job and not self._titles_future
+                and self._carry_over_cache(revision, "projects", "titles", "filtered_titles")):
+            self._drop_titles(self._selected_title_ids)
+            self._refresh_projects()
+        else:
+            self._refresh_data()
+        if success_count:
+            self._drop_pending_titles(self._selected_title_ids)
         
         # Clear selection
         self._selected_title_ids = set()
 
+    def _drop_titles(self, title_ids: Set[int]) -> None:
+        """Remove deleted titles from the cached results and the titles treeview.
+
+        Args:
+            title_ids: IDs of the deleted titles
+        """
+        for key in ("titles", "filtered_titles"):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache[key] = (cached[0], cached[1], [t for t in cached[2] if t['id'] not in title_ids])
+        if self._titles_tree:
+            shown = self._title_rows
+            deleted = [iid for iid in map(str, title_ids) if iid in shown]
+            if deleted:
+                self._titles_tree.delete(*deleted)
+                for iid in deleted:
+                    del shown[iid]
+
+    def _drop_pending_titles(self, title_ids: Set[int]) -> None:
+        """Drop staged reassignments of titles that no longer exist.
+
+        Args:
+            title_ids: IDs of the deleted or merged away titles
+        """
+        edits = [
+            (operation, params) for operation, params in self._pending_edits
+            if not (operation == "assign_project" and params[1] in title_ids)
+        ]
+        if len(edits) == len(self._pending_edits):
+            return
+        self._pending_edits = edits
+        if self._shown_titles is not None:
+            self._shown_titles = [t for t in self._shown_titles if t['id'] not in title_ids]
+        self._update_pending_edits()
+
     def _on_reassign_titles(self) -> None:
         """Reassign selected window titles to a different project."""
         if not self._selected_title_ids:
@@ -620,36 +948,13 @@ class DatabaseManagementWindow:
         
         def on_confirm():
             # Find project ID by name
-            project_name = project_var.get()
-            project_id = None
-            for pid, pname in self._projects_dict.items():
-                if pname == project_name:
-                    project_id = pid
-                    break
-                    
+            project_id = self._projects_by_name.get(project_var.get())
+
             if project_id is not None:
-                # Reassign each title
-                success_count = 0
+                # Stage the reassignments, they are written when the edits are applied
                 for title_id in self._selected_title_ids:
-                    if self._db_manager.assign_project(title_id, project_id):
-                        success_count += 1
-                
-                # Report results and refresh
-                count = len(self._selected_title_ids)
-                if success_count == count:
-                    messagebox.showinfo(
-                        "[W.A.L.] - Success",
-                        f"Successfully reassigned {success_count} window title{'s' if success_count > 1 else ''}.",
-                        parent=self._window
-                    )
-                else:
-                    messagebox.showwarning(
-                        "[W.A.L.] - Partial Success",
-                        f"Reassigned {success_count} out of {count} window titles.",
-                        parent=self._window
-                    )
-                
-                self._refresh_data()
+                    self._pending_edits.append(("assign_project", (project_id, title_id)))
+                self._update_pending_edits()
             
             dialog.destroy()
             
@@ -688,7 +993,8 @@ class DatabaseManagementWindow:
         
         for item_id in self._titles_tree.selection():
             title_id = int(item_id)
-            values = self._titles_tree.item(item_id, "values")
+            # The shown values are tracked already, no need to read them back from the tree
+            values = self._title_rows[item_id]
             title = values[1]  # Title is second column
             selected_titles.append(title)
             title_id_map[title] = title_id
@@ -723,6 +1029,7 @@ class DatabaseManagementWindow:
             
             # Refresh data
             self._refresh_data()
+            self._drop_pending_titles(set(merge_ids))
             
             # Clear selection
             self._selected_title_ids = set()
@@ -733,7 +1040,103 @@ class DatabaseManagementWindow:
                 parent=self._window
             )
 
+    def _update_pending_edits(self) -> None:
+        """Show the staged edits in the trees and enable the buttons acting on them."""
+        count = len(self._pending_edits)
+        state = tk.NORMAL if count else tk.DISABLED
+        if self._pending_label:
+            self._pending_label.config(text=f"{count} pending change{'s' if count != 1 else ''}" if count else "")
+        if self._apply_btn:
+            self._apply_btn.config(state=state)
+        if self._discard_btn:
+            self._discard_btn.config(state=state)
+
+        # Later edits of the same project or title replace earlier ones
+        self._staged_names = {}
+        self._staged_projects = {}
+        for operation, params in self._pending_edits:
+            if operation == "rename_project":
+                self._staged_names[params[1]] = params[0]
+            elif operation == "assign_project":
+                self._staged_projects[params[1]] = params[0]
+
+        # Show the staged values in the rows they affect
+        if self._projects_tree:
+            self._refresh_projects()
+        if self._titles_tree and self._shown_titles is not None:
+            if self._titles_fill_job:
+                self._titles_tree.after_cancel(self._titles_fill_job)
+                self._titles_fill_job = None
+            self._show_titles(self._shown_titles)
+
+    def _on_apply_edits(self) -> None:
+        """Write all staged edits to the database in one transaction."""
+        if not self._pending_edits:
+            return
+
+        if self._db_manager.apply_batch(self._pending_edits):
+            self._pending_edits = []
+            self._update_pending_edits()
+            self._refresh_data()
+        else:
+            messagebox.showerror(
+                "[W.A.L.] - Error",
+                "Failed to apply changes. A project name may already exist.\n\n"
+                "No changes were saved, discard them or try again.",
+                parent=self._window
+            )
+
+    def _on_discard_edits(self) -> None:
+        """Drop all staged edits."""
+        self._pending_edits = []
+        self._update_pending_edits()
+
     def _on_close(self) -> None:
-        """Handle window close event."""
+        """Handle window close event, asking what to do with staged edits first."""
+        if self._pending_edits:
+            count = len(self._pending_edits)
+            result = messagebox.askyesnocancel(
+                "[W.A.L.] - Pending Changes",
+                f"Apply {count} pending change{'s' if count != 1 else ''} before closing?\n\n"
+                f"- Click 'Yes' to apply them\n"
+                f"- Click 'No' to discard them\n"
+                f"- Click 'Cancel' to keep the window open",
+                parent=self._window
+            )
+            if result is None:  # Cancel
+                return
+            if result:
+                self._on_apply_edits()
+                if self._pending_edits:
+                    return  # Not applied, the error was shown and the window stays open
+            else:
+                self._on_discard_edits()
+        self._hide()
+
+    def shutdown(self) -> None:
+        """Apply staged edits without asking and hide the window, when the application stops."""
+        if self._pending_edits:
+            if self._db_manager.apply_batch(self._pending_edits):
+                self._pending_edits = []
+            else:
+                logger.error("Discarding %d pending changes that could not be applied", len(self._pending_edits))
+        self._hide()
+        self._io.shutdown(wait=False, cancel_futures=True)
+
+    def _hide(self) -> None:
+        """Withdraw the window, it is shown again as it was."""
+        self._visible = False
+
+        # Stop updating the hidden trees, the rest is filled in when shown again
+        if self._search_after_id or self._titles_fill_job:
+            if self._search_after_id:
+                self._window.after_cancel(self._search_after_id)
+                self._search_after_id = None
+            if self._titles_fill_job:
+                self._titles_tree.after_cancel(self._titles_fill_job)
+                self._titles_fill_job = None
+            self._titles_state = None
+            self._shown_revision = None
+
         if self._window:
             self._window.withdraw()  # Hide window rather than destroying it
\ No newline at end of file
@@ -2,11 +2,16 @@
 Database manager for handling SQLite operations and schema management.
 """
 import contextlib
-import hashlib
+import functools
+import itertools
+import json
+import logging
 import os
 import shutil
 import sqlite3
+import threading
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple, Iterator, Any, Dict, TYPE_CHECKING, Set
@@ -14,7 +19,22 @@ from typing import List, Optional, Tuple, Iterator, Any, Dict, TYPE_CHECKING, Se
 if TYPE_CHECKING:
     from application import Application
 
+logger = logging.getLogger(__name__)
+
+def _epoch(timestamp: datetime) -> int:
+    """Convert a local timestamp to Unix time in seconds, as stored in WindowLog."""
+    return int(timestamp.timestamp())
+
+@functools.lru_cache(maxsize=4096)
+def _title_id(title: str) -> int:
+    """Compute the CRC32 ID of a window title, repeated titles are served from the cache."""
+    return zlib.crc32(title.encode())
+
 class DatabaseManager:
+    # Stored as the database's user_version once _CREATE_TABLES_SQL and the
+    # migrations have been applied, raise it whenever either of them changes
+    _SCHEMA_VERSION = 2
+
     # SQL statements for schema creation
     _CREATE_TABLES_SQL = [
         """
@@ -28,25 +48,115 @@ class DatabaseManager:
             ID INTEGER PRIMARY KEY,  -- CRC32 hash of title
             Title TEXT NOT NULL UNIQUE,
             ProjectID INTEGER,
-            FOREIGN KEY (ProjectID) REFERENCES Projects(ID)
+            FOREIGN KEY (ProjectID) REFERENCES Projects(ID) ON DELETE CASCADE
         )
         """,
         """
         CREATE TABLE IF NOT EXISTS WindowLog (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
             TitleID INTEGER NOT NULL,
-            StartTimestamp DATETIME NOT NULL,
-            EndTimestamp DATETIME,
-            FOREIGN KEY (TitleID) REFERENCES WindowTitles(ID)
+            StartTimestamp INTEGER NOT NULL,  -- Unix time in seconds
+            EndTimestamp INTEGER,
+            FOREIGN KEY (TitleID) REFERENCES WindowTitles(ID) ON DELETE CASCADE
         )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_wt_project ON WindowTitles(ProjectID)
+        """,
+        # Time range scans of the summaries, and the single open log entry closed on every change
+        """
+        CREATE INDEX IF NOT EXISTS idx_wl_start ON WindowLog(StartTimestamp)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_wl_open ON WindowLog(EndTimestamp) WHERE EndTimestamp IS NULL
+        """,
+        # Covers _PERIOD_LOGS_SQL, entries ending after a period start are a range of it
+        """
+        CREATE INDEX IF NOT EXISTS idx_wl_end ON WindowLog(EndTimestamp, StartTimestamp, TitleID)
+        """,
+        # Log entries of a title, for deletes and merges, covering the title statistics
+        """
+        CREATE INDEX IF NOT EXISTS idx_wl_title_span ON WindowLog(TitleID, StartTimestamp, EndTimestamp)
         """
     ]
 
+    # Indexes of earlier versions that were replaced by one in _CREATE_TABLES_SQL
+    _DROP_INDEXES_SQL = [
+        "DROP INDEX IF EXISTS idx_wl_title"
+    ]
+
+    # Statements for edits that can be staged and applied together with apply_batch
+    _BATCH_SQL = {
+        "assign_project": "UPDATE WindowTitles SET ProjectID = ? WHERE ID = ?",
+        "rename_project": "UPDATE Projects SET ProjectName = ? WHERE ID = ? AND ID != 1"
+    }
+
     # SQL for initial data
     _INITIAL_DATA_SQL = """
         INSERT OR IGNORE INTO Projects (ID, ProjectName) VALUES (1, 'Misc')
     """
 
+    # Rebuilds the tables of databases created before their foreign keys cascaded,
+    # {create} is the table's statement from _CREATE_TABLES_SQL. Rows pointing at
+    # a missing parent would violate the enforced keys, titles of a missing
+    # project move to the default project and logs of a missing title are dropped
+    _CASCADE_REBUILD_SQL = {
+        "WindowTitles": """
+            INSERT INTO WindowTitles_new (ID, Title, ProjectID)
+            SELECT wt.ID, wt.Title, IFNULL((SELECT p.ID FROM Projects p WHERE p.ID = wt.ProjectID), 1)
+            FROM WindowTitles wt
+        """,
+        "WindowLog": """
+            INSERT INTO WindowLog_new (ID, TitleID, StartTimestamp, EndTimestamp)
+            SELECT ID, TitleID, StartTimestamp, EndTimestamp
+            FROM WindowLog
+            WHERE TitleID IN (SELECT ID FROM WindowTitles)
+        """
+    }
+
+    # Converts timestamps written as text by earlier versions to Unix time,
+    # the text holds local time, values that cannot be parsed are left as they are
+    _MIGRATE_TIMESTAMPS_SQL = [
+        """
+        UPDATE WindowLog
+        SET StartTimestamp = CAST(strftime('%s', StartTimestamp, 'utc') AS INTEGER)
+        WHERE typeof(StartTimestamp) = 'text' AND strftime('%s', StartTimestamp, 'utc') IS NOT NULL
+        """,
+        """
+        UPDATE WindowLog
+        SET EndTimestamp = CAST(strftime('%s', EndTimestamp, 'utc') AS INTEGER)
+        WHERE typeof(EndTimestamp) = 'text' AND strftime('%s', EndTimestamp, 'utc') IS NOT NULL
+        """
+    ]
+
+    # Statements run for every logged title change, kept identical so the
+    # connection's statement cache reuses their compiled form
+    _INSERT_TITLE_SQL = "INSERT OR IGNORE INTO WindowTitles (ID, Title, ProjectID) VALUES (?, ?, 1)"
+    _CLOSE_OPEN_LOGS_SQL = "UPDATE WindowLog SET EndTimestamp = ? WHERE EndTimestamp IS NULL"
+    _CLOSE_LOG_SQL = "UPDATE WindowLog SET EndTimestamp = ? WHERE ID = ? AND EndTimestamp IS NULL"
+    _INSERT_LOG_SQL = "INSERT INTO WindowLog (TitleID, StartTimestamp, EndTimestamp) VALUES (?, ?, ?)"
+
+    # Compiled statements kept by the connection, the title queries alone have four variants
+    _CACHED_STATEMENTS = 256
+
+    # Applied once when the connection is opened, WAL turns each commit into an append.
+    # Without WAL, e.g. on network drives, the rollback journal stays with full syncs
+    _WAL_PRAGMAS = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL"
+    ]
+    _ROLLBACK_PRAGMAS = [
+        "PRAGMA journal_mode=DELETE",
+        "PRAGMA synchronous=FULL"
+    ]
+    _CONNECTION_PRAGMAS = [
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA foreign_keys=ON"
+    ]
+
     def __init__(self, app: 'Application'):
         """Initialize the database manager.
 
@@ -55,25 +165,101 @@ class DatabaseManager:
         """
         self._app = app
         self._db_path = app.configuration.get_database_path()
+        self._db_path_str = app.configuration.get_database_path_str()
+        self._revision_counter = itertools.count(1)
+        self._revision = 0
+        self._conn: Optional[sqlite3.Connection] = None  # Opened on first use
+        self._lock = threading.RLock()  # Serializes use of the connection across threads
+        self._open_log_id: Optional[int] = None  # Log entry left open by the last logged title
+        self._known_title_ids: Set[int] = set()  # Titles known to be stored, their insert is skipped
+        self._maintenance = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DatabaseMaintenance")
+
+    @property
+    def revision(self) -> int:
+        """Number that changes whenever data is written, for caching query results."""
+        return self._revision
+
+    @property
+    def open_log_id(self) -> Optional[int]:
+        """ID of the log entry left open by the last logged title, None once it is forgotten."""
+        return self._open_log_id
+
+    def mark_changed(self) -> None:
+        """Record that the database contents changed outside of this class' write methods."""
+        with self._lock:
+            self._known_title_ids.clear()  # Titles may have been deleted
+            self._revision = next(self._revision_counter)
+
+    def _set_db_path(self, path: Path) -> None:
+        """Switch to a different database file.
+
+        Args:
+            path: Path of the database file
+        """
+        self.close()
+        self._open_log_id = None
+        self._db_path = path
+        self._db_path_str = str(path)
+        self.mark_changed()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection to the current database file and apply the connection pragmas.
+
+        Returns:
+            The new connection
+        """
+        conn = sqlite3.connect(
+            self._db_path_str,
+            check_same_thread=False,
+            cached_statements=self._CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        try:
+            journal_mode = conn.execute(self._WAL_PRAGMAS[0]).fetchone()[0]
+        except sqlite3.OperationalError as e:
+            journal_mode = str(e)
+        if journal_mode == "wal":
+            conn.execute(self._WAL_PRAGMAS[1])
+        else:
+            logger.warning("WAL journal not available (%s), using the rollback journal", journal_mode)
+            for pragma in self._ROLLBACK_PRAGMAS:
+                conn.execute(pragma)
+        for pragma in self._CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     @contextlib.contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get a database connection within a context.
+        """Get the shared database connection within a context.
+
+        The connection stays open between uses and is locked for the duration
+        of the context. Changes that were not committed are rolled back at the
+        end, as closing a connection would have done.
 
         Yields:
-            A database connection that will be automatically closed
+            The database connection
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(
-                self._db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-            )
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            conn = self._conn
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+
+    def close(self) -> None:
+        """Close the database connection, it is opened again on next use."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # Refresh the statistics the planner uses, if this session made them stale
+                    self._conn.execute("PRAGMA optimize")
+                    self._conn.close()
+                except Exception as e:
+                    logger.error("Error closing database: %s", e)
+                self._conn = None
 
     def _generate_title_id(self, title: str) -> int:
         """Generate a numeric ID for a window title using CRC32.
@@ -84,7 +270,7 @@ class DatabaseManager:
         Returns:
             A positive 32-bit integer hash of the title
         """
-        return zlib.crc32(title.encode()) & 0xFFFFFFFF
+        return _title_id(title)
 
     def initialize(self) -> bool:
         """Initialize the database and create schema if needed.
@@ -101,39 +287,114 @@ class DatabaseManager:
 
             # Create schema and initial data
             with self._get_connection() as conn:
-                # Create schema
-                for sql in self._CREATE_TABLES_SQL:
-                    conn.execute(sql)
+                # Databases already at the current schema version skip schema work
+                if conn.execute("PRAGMA user_version").fetchone()[0] < self._SCHEMA_VERSION:
+                    self._upgrade_schema(conn)
 
-                # Insert initial data
-                conn.execute(self._INITIAL_DATA_SQL)
-
-                # Set end timestamp of any existing open window logs
-                current_time = datetime.now()
-                conn.execute(
-                    """
-                    UPDATE WindowLog
-                    SET EndTimestamp = ?
-                    WHERE EndTimestamp IS NULL
-                    """,
-                    (current_time,)
-                )
+                # Set end timestamp of any existing open window logs, idx_wl_open
+                # finds them without a scan and the update is skipped if there are none
+                if conn.execute("SELECT 1 FROM WindowLog WHERE EndTimestamp IS NULL LIMIT 1").fetchone():
+                    conn.execute(self._CLOSE_OPEN_LOGS_SQL, (_epoch(datetime.now()),))
+                self._open_log_id = None
 
                 conn.commit()
+                self.mark_changed()
+
+                # Titles that exist now do not have to be inserted when logged
+                self._known_title_ids.update(row[0] for row in conn.execute("SELECT ID FROM WindowTitles"))
             return True
 
         except Exception as e:
-            print(f"Error initializing database: {e}")
+            logger.error("Error initializing database: %s", e)
             return False
 
+    def _upgrade_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the schema and bring databases of earlier versions up to date.
+
+        Everything after the foreign key rebuild runs as one script in a single
+        transaction, which also stores the new schema version.
+
+        Args:
+            conn: Connection to the database, not inside a transaction
+        """
+        # Older databases get their foreign keys replaced first
+        self._add_cascading_keys(conn)
+
+        # Create schema, insert initial data and convert text timestamps of older databases
+        statements = [
+            *self._DROP_INDEXES_SQL,
+            *self._CREATE_TABLES_SQL,
+            self._INITIAL_DATA_SQL,
+            *self._MIGRATE_TIMESTAMPS_SQL
+        ]
+        conn.executescript(
+            "BEGIN;"
+            + ";".join(statements)
+            + f"; PRAGMA user_version = {self._SCHEMA_VERSION}; COMMIT;"
+        )
+
+        # Gather statistics so the planner knows about the new indexes
+        conn.execute("ANALYZE")
+        conn.commit()
+
+    def _add_cascading_keys(self, conn: sqlite3.Connection) -> None:
+        """Rebuild tables whose foreign keys do not cascade deletes yet.
+
+        SQLite cannot alter a foreign key, so each table is copied into a new
+        one with the current definition, which then replaces it. Indexes are
+        created again with the rest of the schema afterwards.
+
+        Args:
+            conn: Connection to the database, not inside a transaction
+        """
+        outdated = [
+            table for table in self._CASCADE_REBUILD_SQL
+            if any(row['on_delete'] != 'CASCADE' for row in conn.execute(f"PRAGMA foreign_key_list({table})"))
+        ]
+        if not outdated:
+            return
+
+        # Foreign keys can only be switched off outside of a transaction
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            conn.execute("BEGIN")
+            for table in outdated:
+                create = next(sql for sql in self._CREATE_TABLES_SQL if f"EXISTS {table} (" in sql)
+                conn.execute(create.replace(f"IF NOT EXISTS {table} (", f"{table}_new ("))
+                conn.execute(self._CASCADE_REBUILD_SQL[table])
+                conn.execute(f"DROP TABLE {table}")
+                conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+            conn.commit()
+            logger.info("Rebuilt tables %s with cascading foreign keys", ", ".join(outdated))
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
     def _handle_config_update(self) -> None:
-        """Handle configuration updates."""
+        """Handle configuration updates.
+
+        Validating, repairing or creating the new database can take a while, so
+        the switch runs on the maintenance thread and this returns right away.
+        """
+        if self._app.configuration.get_database_path_str() != self._db_path_str:
+            self._maintenance.submit(self._switch_database)
+
+    def _switch_database(self) -> None:
+        """Switch to the database path from the configuration, reverting on failure.
+
+        The connection lock is held throughout, writes wait for the new database.
+        """
         try:
-            new_path = self._app.configuration.get_database_path()
-            if new_path != self._db_path:
+            with self._lock:
+                if self._app.configuration.get_database_path_str() == self._db_path_str:
+                    return  # Already switched by an earlier update
+
                 # Save the old path in case we need to restore it
                 old_path = self._db_path
-                self._db_path = new_path
+                new_path = self._app.configuration.get_database_path()
+                self._set_db_path(new_path)
 
                 # If the new database exists, validate and repair if needed
                 if new_path.exists():
@@ -141,25 +402,30 @@ class DatabaseManager:
                         # Invalid schema, attempt backup and repair
                         if not self.backup_and_repair():
                             # If repair failed, restore old path and report error
-                            self._db_path = old_path
-                            print("Failed to repair database at new location, reverting to previous database")
+                            self._set_db_path(old_path)
+                            logger.error("Failed to repair database at new location, reverting to previous database")
                             return
+                    elif not self.initialize():
+                        # Valid schema, but indexes and timestamp conversion could not be applied
+                        self._set_db_path(old_path)
+                        logger.error("Failed to prepare database at new location, reverting to previous database")
+                        return
                 else:
                     # New database file, create directory and initialize
                     try:
                         os.makedirs(new_path.parent, exist_ok=True)
                         if not self.initialize():
                             # If initialization failed, restore old path
-                            self._db_path = old_path
-                            print("Failed to initialize new database, reverting to previous database")
+                            self._set_db_path(old_path)
+                            logger.error("Failed to initialize new database, reverting to previous database")
                             return
                     except Exception as e:
-                        self._db_path = old_path
-                        print(f"Error creating new database: {e}")
+                        self._set_db_path(old_path)
+                        logger.error("Error creating new database: %s", e)
                         return
 
         except Exception as e:
-            print(f"Error handling configuration update: {e}")
+            logger.error("Error handling configuration update: %s", e)
 
     def log_window_title(self, title: str, timestamp: datetime) -> bool:
         """Log a window title change.
@@ -171,40 +437,107 @@ class DatabaseManager:
         Returns:
             bool: True if logging was successful, False otherwise
         """
-        try:
-            with self._get_connection() as conn:
-                # Generate title ID (CRC32 hash)
-                title_id = self._generate_title_id(title)
+        return self.log_window_titles([(title, timestamp)])
 
-                # Insert or ignore title
-                conn.execute(
-                    "INSERT OR IGNORE INTO WindowTitles (ID, Title, ProjectID) VALUES (?, ?, 1)",
-                    (title_id, title)
-                )
+    def log_window_titles(self, entries: List[Tuple[str, datetime]]) -> bool:
+        """Log several window title changes in a single transaction.
 
-                # Update end timestamp of previous log entry
-                conn.execute(
-                    """
-                    UPDATE WindowLog
-                    SET EndTimestamp = ?
-                    WHERE EndTimestamp IS NULL
-                    """,
-                    (timestamp,)
-                )
+        Args:
+            entries: (title, timestamp) pairs in the order they occurred
 
-                # Insert new log entry
-                conn.execute(
-                    "INSERT INTO WindowLog (TitleID, StartTimestamp) VALUES (?, ?)",
-                    (title_id, timestamp)
+        Returns:
+            bool: True if logging was successful, False otherwise
+        """
+        if not entries:
+            return True
+
+        try:
+            # Generate title IDs (CRC32 hash), before taking the connection lock
+            title_ids = [_title_id(title) for title, _ in entries]
+
+            with self._get_connection() as conn:
+                # Insert or ignore titles not logged or loaded before
+                known = self._known_title_ids
+                new_titles = [
+                    (title_id, title) for title_id, (title, _) in zip(title_ids, entries)
+                    if title_id not in known
+                ]
+                if new_titles:
+                    conn.executemany(self._INSERT_TITLE_SQL, new_titles)
+
+                # Update end timestamp of previous log entry, by its ID if it is known and
+                # still open, otherwise whatever entries are open
+                start_times = [_epoch(timestamp) for _, timestamp in entries]
+                closed = 0
+                if self._open_log_id is not None:
+                    closed = conn.execute(self._CLOSE_LOG_SQL, (start_times[0], self._open_log_id)).rowcount
+                if not closed:
+                    conn.execute(self._CLOSE_OPEN_LOGS_SQL, (start_times[0],))
+
+                # Insert new log entries, each one ends when the next one starts
+                conn.executemany(
+                    self._INSERT_LOG_SQL,
+                    [
+                        (title_id, start_time, end_time)
+                        for title_id, start_time, end_time in zip(title_ids, start_times[:-1], start_times[1:])
+                    ]
                 )
+                open_log_id = conn.execute(self._INSERT_LOG_SQL, (title_ids[-1], start_times[-1], None)).lastrowid
 
                 conn.commit()
+                self._open_log_id = open_log_id
+                known.update(title_id for title_id, _ in new_titles)
+                # Only titles were added, so the known titles stay valid
+                self._revision = next(self._revision_counter)
                 return True
 
         except Exception as e:
-            print(f"Error logging window title: {e}")
+            logger.error("Error logging window titles: %s", e)
             return False
 
+    # Title and duration of the log entries overlapping a period, ?1 being its end
+    # and ?2 its start. Closed and open entries are separate index ranges, an OR
+    # of both would scan every entry that started before the period end
+    _PERIOD_LOGS_SQL = """
+        SELECT TitleID, EndTimestamp - StartTimestamp AS Duration
+        FROM WindowLog
+        WHERE EndTimestamp >= ?2 AND StartTimestamp <= ?1
+        UNION ALL
+        SELECT TitleID, ?1 - StartTimestamp
+        FROM WindowLog
+        WHERE EndTimestamp IS NULL AND StartTimestamp <= ?1
+    """
+
+    # Summaries of a period, both complete at class creation so every call passes
+    # the statement cache the same string
+    _TITLE_SUMMARY_SQL = f"""
+        SELECT
+            wt.Title,
+            SUM(wl.Duration) as duration,
+            wt.ProjectID
+        FROM ({_PERIOD_LOGS_SQL}) wl
+        JOIN WindowTitles wt ON wl.TitleID = wt.ID
+        GROUP BY wt.ID
+        ORDER BY duration DESC
+    """
+    _PROJECT_SUMMARY_SQL = f"""
+        SELECT
+            p.ID,
+            p.ProjectName,
+            SUM(wl.Duration) as duration
+        FROM (
+            -- Summed per title first, the joins then run once per title, not per entry
+            SELECT TitleID, SUM(Duration) AS Duration
+            FROM ({_PERIOD_LOGS_SQL})
+            GROUP BY TitleID
+        ) wl
+        JOIN WindowTitles wt ON wl.TitleID = wt.ID
+        JOIN Projects p ON wt.ProjectID = p.ID
+        GROUP BY p.ID
+        HAVING duration > 0
+        ORDER BY duration DESC
+    """
+
     def get_title_summary(self, start_time: datetime, end_time: datetime) -> List[Tuple[str, float, int]]:
         """Get summary of window titles and their durations in seconds.
 
@@ -217,33 +550,12 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT
-                        wt.Title,
-                        SUM(
-                            CASE
-                                WHEN wl.EndTimestamp IS NULL THEN
-                                    strftime('%s', ?) - strftime('%s', wl.StartTimestamp)
-                                ELSE
-                                    strftime('%s', wl.EndTimestamp) - strftime('%s', wl.StartTimestamp)
-                            END
-                        ) as duration,
-                        wt.ProjectID
-                    FROM WindowLog wl
-                    JOIN WindowTitles wt ON wl.TitleID = wt.ID
-                    WHERE wl.StartTimestamp <= ?
-                    AND (wl.EndTimestamp >= ? OR wl.EndTimestamp IS NULL)
-                    GROUP BY wt.Title
-                    ORDER BY duration DESC
-                    """,
-                    (end_time, end_time, start_time)
-                )
-                return [(row['Title'], row['duration'], row["ProjectID"]) for row in cursor.fetchall()]
+                cursor = conn.execute(self._TITLE_SUMMARY_SQL, (_epoch(end_time), _epoch(start_time)))
+                cursor.row_factory = None  # Plain tuples, read by position
+                return cursor.fetchall()
 
         except Exception as e:
-            print(f"Error getting title summary: {e}")
+            logger.error("Error getting title summary: %s", e)
             return []
 
     def get_project_summary(self, start_time: datetime, end_time: datetime) -> List[Tuple[int, str, float]]:
@@ -258,37 +570,57 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT
-                        p.ID,
-                        p.ProjectName,
-                        SUM(
-                            CASE
-                                WHEN wl.EndTimestamp IS NULL THEN
-                                    strftime('%s', ?) - strftime('%s', wl.StartTimestamp)
-                                ELSE
-                                    strftime('%s', wl.EndTimestamp) - strftime('%s', wl.StartTimestamp)
-                            END
-                        ) as duration
-                    FROM WindowLog wl
-                    JOIN WindowTitles wt ON wl.TitleID = wt.ID
-                    JOIN Projects p ON wt.ProjectID = p.ID
-                    WHERE wl.StartTimestamp <= ?
-                    AND (wl.EndTimestamp >= ? OR wl.EndTimestamp IS NULL)
-                    GROUP BY p.ProjectName
-                    HAVING duration > 0
-                    ORDER BY duration DESC
-                    """,
-                    (end_time, end_time, start_time)
-                )
-                return [(row["ID"], row['ProjectName'], row['duration']) for row in cursor.fetchall()]
+                cursor = conn.execute(self._PROJECT_SUMMARY_SQL, (_epoch(end_time), _epoch(start_time)))
+                cursor.row_factory = None  # Plain tuples, read by position
+                return cursor.fetchall()
 
         except Exception as e:
-            print(f"Error getting project summary: {e}")
+            logger.error("Error getting project summary: %s", e)
             return []
 
+    def get_combined_summary(
+        self, start_time: datetime, end_time: datetime
+    ) -> Tuple[List[Tuple[str, float, int]], List[Tuple[int, str, float]]]:
+        """Get the title and project summaries of a period with a single pass over the log.
+
+        Project durations are the sums of their titles, the same totals
+        get_project_summary computes.
+
+        Args:
+            start_time: Start of the period to summarize
+            end_time: End of the period to summarize
+
+        Returns:
+            Tuple of the get_title_summary and the get_project_summary result
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(self._TITLE_SUMMARY_SQL, (_epoch(end_time), _epoch(start_time)))
+                cursor.row_factory = None  # Plain tuples, read by position
+                title_data = cursor.fetchall()
+
+                cursor = conn.execute("SELECT ID, ProjectName FROM Projects")
+                cursor.row_factory = None
+                project_names = dict(cursor.fetchall())
+
+        except Exception as e:
+            logger.error("Error getting combined summary: %s", e)
+            return [], []
+
+        totals: Dict[int, float] = {}
+        for _, duration, project_id in title_data:
+            totals[project_id] = totals.get(project_id, 0) + duration
+        project_data = sorted(
+            (
+                (project_id, project_names[project_id], duration)
+                for project_id, duration in totals.items()
+                if duration > 0 and project_id in project_names
+            ),
+            key=lambda row: row[2],
+            reverse=True
+        )
+        return title_data, project_data
+
     def assign_project(self, title_id: int, project_id: int) -> bool:
         """Assign a window title to a project.
 
@@ -306,10 +638,11 @@ class DatabaseManager:
                     (project_id, title_id)
                 )
                 conn.commit()
+                self.mark_changed()
                 return True
 
         except Exception as e:
-            print(f"Error assigning project: {e}")
+            logger.error("Error assigning project: %s", e)
             return False
 
     def create_project(self, project_name: str) -> Optional[int]:
@@ -323,16 +656,16 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+                cursor = conn.execute(
                     "INSERT INTO Projects (ProjectName) VALUES (?)",
                     (project_name,)
                 )
                 conn.commit()
+                self.mark_changed()
                 return cursor.lastrowid
 
         except Exception as e:
-            print(f"Error creating project: {e}")
+            logger.error("Error creating project: %s", e)
             return None
 
     def rename_project(self, project_id: int, new_name: str) -> bool:
@@ -348,20 +681,55 @@ class DatabaseManager:
         try:
             # Don't allow renaming the default project
             if project_id == 1:
-                print("Cannot rename the default project")
+                logger.warning("Cannot rename the default project")
                 return False
 
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+                cursor = conn.execute(
                     "UPDATE Projects SET ProjectName = ? WHERE ID = ?",
                     (new_name, project_id)
                 )
                 conn.commit()
+                self.mark_changed()
                 return cursor.rowcount > 0
 
         except Exception as e:
-            print(f"Error renaming project: {e}")
+            logger.error("Error renaming project: %s", e)
+            return False
+
+    def apply_batch(self, edits: List[Tuple[str, tuple]]) -> bool:
+        """Apply several edits in a single transaction, in the order given.
+
+        Args:
+            edits: (operation, parameters) pairs, the operation being a key of _BATCH_SQL
+                   and the parameters matching its statement
+
+        Returns:
+            bool: True if all edits were applied, False if none were
+        """
+        if not edits:
+            return True
+
+        try:
+            for operation, _ in edits:
+                if operation not in self._BATCH_SQL:
+                    raise ValueError(f"Unknown batch operation: {operation}")
+
+            with self._get_connection() as conn:
+                try:
+                    # Later edits can depend on earlier ones, like two renames swapping
+                    # names, so only consecutive edits of one operation run together
+                    for operation, run in itertools.groupby(edits, key=lambda edit: edit[0]):
+                        conn.executemany(self._BATCH_SQL[operation], [params for _, params in run])
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                self.mark_changed()
+                return True
+
+        except Exception as e:
+            logger.error("Error applying edits: %s", e)
             return False
 
     def delete_project(self, project_id: int, delete_titles: bool = False) -> bool:
@@ -378,47 +746,29 @@ class DatabaseManager:
         try:
             # Don't allow deleting the default project
             if project_id == 1:
-                print("Cannot delete the default project")
+                logger.warning("Cannot delete the default project")
                 return False
 
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                if delete_titles:
-                    # First delete all window logs for titles in this project
-                    cursor.execute(
-                        """
-                        DELETE FROM WindowLog
-                        WHERE TitleID IN (
-                            SELECT ID FROM WindowTitles WHERE ProjectID = ?
-                        )
-                        """,
-                        (project_id,)
-                    )
-
-                    # Then delete all titles in this project
-                    cursor.execute(
-                        "DELETE FROM WindowTitles WHERE ProjectID = ?",
-                        (project_id,)
-                    )
-                else:
+                if not delete_titles:
                     # Reassign all titles to the default project (ID = 1)
-                    cursor.execute(
+                    conn.execute(
                         "UPDATE WindowTitles SET ProjectID = 1 WHERE ProjectID = ?",
                         (project_id,)
                     )
 
-                # Finally delete the project
-                cursor.execute(
+                # Delete the project, its remaining titles and their logs cascade with it
+                cursor = conn.execute(
                     "DELETE FROM Projects WHERE ID = ?",
                     (project_id,)
                 )
 
                 conn.commit()
+                self.mark_changed()
                 return cursor.rowcount > 0
 
         except Exception as e:
-            print(f"Error deleting project: {e}")
+            logger.error("Error deleting project: %s", e)
             return False
 
     def validate_schema(self) -> bool:
@@ -429,8 +779,6 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-
                 # Check each table exists with correct columns
                 tables = {
                     "Projects": {"ID", "ProjectName"},
@@ -438,26 +786,39 @@ class DatabaseManager:
                     "WindowLog": {"ID", "TitleID", "StartTimestamp", "EndTimestamp"}
                 }
 
-                for table, expected_columns in tables.items():
-                    # Get table info
-                    cursor.execute(f"PRAGMA table_info({table})")
-                    columns = {row['name'] for row in cursor.fetchall()}
+                # Read the columns of all tables at once
+                cursor = conn.execute(
+                    """
+                    SELECT m.name, p.name
+                    FROM sqlite_master m
+                    JOIN pragma_table_info(m.name) p
+                    WHERE m.type = 'table' AND m.name IN ('Projects', 'WindowTitles', 'WindowLog')
+                    """
+                )
+                columns: Dict[str, Set[str]] = {}
+                for table, column in cursor.fetchall():
+                    columns.setdefault(table, set()).add(column)
 
-                    # Check if all expected columns exist
-                    if not expected_columns.issubset(columns):
+                # Check if all expected columns exist
+                for table, expected_columns in tables.items():
+                    if not expected_columns.issubset(columns.get(table, ())):
                         return False
 
                 # Verify foreign key constraints
-                cursor.execute("PRAGMA foreign_key_check")
+                cursor = conn.execute("PRAGMA foreign_key_check")
                 if cursor.fetchone() is not None:
                     return False
 
                 return True
 
         except Exception as e:
-            print(f"Error validating schema: {e}")
+            logger.error("Error validating schema: %s", e)
             return False
 
+    # Pages copied per backup step and the pause between steps
+    _BACKUP_PAGES = 1024
+    _BACKUP_SLEEP_SECONDS = 0.05
+
     def backup_and_repair(self) -> bool:
         """Create backup of current database and repair schema.
 
@@ -469,15 +830,29 @@ class DatabaseManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self._db_path.with_name(f"{self._db_path.stem}_backup_{timestamp}{self._db_path.suffix}")
 
-            if self._db_path.exists():
-                shutil.copy2(self._db_path, backup_path)
-                self._db_path.unlink()  # Remove invalid database
-
-            # Reinitialize database
-            return self.initialize()
+            with self._lock:
+                if self._db_path.exists():
+                    try:
+                        # Page level copy through the open connection, consistent with
+                        # what it has written even while the WAL is not checkpointed
+                        with self._get_connection() as conn, \
+                                contextlib.closing(sqlite3.connect(backup_path)) as target:
+                            conn.backup(target, pages=self._BACKUP_PAGES, sleep=self._BACKUP_SLEEP_SECONDS)
+                    except sqlite3.DatabaseError as e:
+                        # Not readable as a database at all, keep the raw file instead
+                        logger.warning("Online backup failed, copying the file: %s", e)
+                        self.close()
+                        shutil.copy2(self._db_path, backup_path)
+
+                    # The file can only be replaced once nothing holds it open
+                    self.close()
+                    self._db_path.unlink()  # Remove invalid database
+
+                # Reinitialize database
+                return self.initialize()
 
         except Exception as e:
-            print(f"Error during backup and repair: {e}")
+            logger.error("Error during backup and repair: %s", e)
             return False
 
     def get_projects(self) -> Dict[int, str]:
@@ -488,62 +863,100 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+                cursor = conn.execute(
                     """
                     SELECT ID, ProjectName
                     FROM Projects
                     ORDER BY ProjectName
                     """
                 )
-                return {row['ID']: row['ProjectName'] for row in cursor.fetchall()}
+                cursor.row_factory = None  # Plain tuples, read by position
+                return dict(cursor.fetchall())
 
         except Exception as e:
-            print(f"Error getting projects: {e}")
+            logger.error("Error getting projects: %s", e)
             return {}
 
+    # Title list with usage statistics, {where} filters it for _TITLES_QUERIES
+    _TITLES_SQL = """
+        SELECT 
+            wt.ID, 
+            wt.Title, 
+            wt.ProjectID,
+            p.ProjectName,
+            COUNT(wl.ID) as LogCount,
+            MIN(wl.StartTimestamp) as FirstSeen,
+            MAX(IFNULL(wl.EndTimestamp, CAST(strftime('%s', 'now') AS INTEGER))) as LastSeen,
+            strftime('%Y-%m-%d %H:%M', MIN(wl.StartTimestamp), 'unixepoch', 'localtime') as FirstSeenText,
+            strftime('%Y-%m-%d %H:%M', MAX(IFNULL(wl.EndTimestamp, CAST(strftime('%s', 'now') AS INTEGER))),
+                     'unixepoch', 'localtime') as LastSeenText
+        FROM WindowTitles wt
+        JOIN Projects p ON wt.ProjectID = p.ID
+        LEFT JOIN WindowLog wl ON wt.ID = wl.TitleID
+        {where}
+        GROUP BY wt.ID, wt.Title, wt.ProjectID
+        ORDER BY wt.Title
+    """
+
+    # Filtered variants of _TITLES_SQL keyed by (search given, project given)
+    _TITLES_QUERIES = {
+        (False, False): _TITLES_SQL.format(where=""),
+        (True, False): _TITLES_SQL.format(where="WHERE wt.Title LIKE ? ESCAPE '\\'"),
+        (False, True): _TITLES_SQL.format(where="WHERE wt.ProjectID = ?"),
+        (True, True): _TITLES_SQL.format(where="WHERE wt.Title LIKE ? ESCAPE '\\' AND wt.ProjectID = ?")
+    }
+
     def get_all_titles(self) -> List[Dict[str, Any]]:
         """Get all window titles with their project assignments.
 
         Returns:
             List of dictionaries containing title information
         """
+        return self.get_titles()
+
+    def get_titles(self, search: Optional[str] = None, project_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get window titles with their project assignments, optionally filtered.
+
+        Args:
+            search: Only include titles containing this text, ignoring ASCII case
+            project_id: Only include titles assigned to this project
+
+        Returns:
+            List of dictionaries containing title information, first_seen and last_seen
+            are Unix times, first_seen_text and last_seen_text hold them formatted for display
+        """
         try:
+            params: List[Any] = []
+            if search:
+                # Match the text literally, LIKE wildcards in it are escaped
+                escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+            if project_id is not None:
+                params.append(project_id)
+            query = self._TITLES_QUERIES[(bool(search), project_id is not None)]
+
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT 
-                        wt.ID, 
-                        wt.Title, 
-                        wt.ProjectID,
-                        p.ProjectName,
-                        COUNT(wl.ID) as LogCount,
-                        MIN(wl.StartTimestamp) as FirstSeen,
-                        MAX(IFNULL(wl.EndTimestamp, CURRENT_TIMESTAMP)) as LastSeen
-                    FROM WindowTitles wt
-                    JOIN Projects p ON wt.ProjectID = p.ID
-                    LEFT JOIN WindowLog wl ON wt.ID = wl.TitleID
-                    GROUP BY wt.ID, wt.Title, wt.ProjectID
-                    ORDER BY wt.Title
-                    """
-                )
+                cursor = conn.execute(query, params)
+                cursor.row_factory = None  # Plain tuples, read by position
                 
-                result = []
-                for row in cursor.fetchall():
-                    result.append({
-                        'id': row['ID'],
-                        'title': row['Title'],
-                        'project_id': row['ProjectID'],
-                        'project_name': row['ProjectName'],
-                        'log_count': row['LogCount'],
-                        'first_seen': row['FirstSeen'],
-                        'last_seen': row['LastSeen']
-                    })
-                return result
+                return [
+                    {
+                        'id': title_id,
+                        'title': title,
+                        'project_id': project_id,
+                        'project_name': project_name,
+                        'log_count': log_count,
+                        'first_seen': first_seen,
+                        'last_seen': last_seen,
+                        'first_seen_text': first_seen_text or "",
+                        'last_seen_text': last_seen_text or ""
+                    }
+                    for (title_id, title, project_id, project_name, log_count,
+                         first_seen, last_seen, first_seen_text, last_seen_text) in cursor.fetchall()
+                ]
 
         except Exception as e:
-            print(f"Error getting all titles: {e}")
+            logger.error("Error getting titles: %s", e)
             return []
 
     def delete_title(self, title_id: int) -> bool:
@@ -555,27 +968,34 @@ class DatabaseManager:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
+        return self.delete_titles([title_id]) > 0
+
+    def delete_titles(self, title_ids: List[int]) -> int:
+        """Delete several window titles and all their log entries in one transaction.
+
+        Args:
+            title_ids: IDs of the window titles to delete
+
+        Returns:
+            int: Number of titles deleted, 0 if the deletion failed
+        """
+        if not title_ids:
+            return 0
+
         try:
+            params = [(title_id,) for title_id in title_ids]
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                # First delete all associated log entries
-                cursor.execute(
-                    "DELETE FROM WindowLog WHERE TitleID = ?",
-                    (title_id,)
-                )
-                
-                # Then delete the title itself
-                cursor.execute(
-                    "DELETE FROM WindowTitles WHERE ID = ?",
-                    (title_id,)
-                )
+                # Their log entries cascade with the titles
+                cursor = conn.executemany("DELETE FROM WindowTitles WHERE ID = ?", params)
                 
                 conn.commit()
-                return cursor.rowcount > 0
+                self._open_log_id = None  # May have been deleted with its title
+                self.mark_changed()
+                return cursor.rowcount
 
         except Exception as e:
-            print(f"Error deleting title: {e}")
-            return False
+            logger.error("Error deleting titles: %s", e)
+            return 0
 
     def merge_titles(self, title_ids: List[int]) -> bool:
         """Merge multiple window titles into a new one.
@@ -587,27 +1007,25 @@ class DatabaseManager:
             bool: True if merge was successful, False otherwise
         """
         if not title_ids or len(title_ids) < 2:
-            print("At least two titles must be selected for merging")
+            logger.warning("At least two titles must be selected for merging")
             return False
 
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get info about the titles to be merged
-                title_ids_str = ','.join(['?'] * len(title_ids))
-                cursor.execute(
-                    f"""
+                # Get info about the titles to be merged, the IDs are bound as one JSON
+                # array so the statements keep the same text for any number of titles
+                cursor = conn.execute(
+                    """
                     SELECT ID, Title, ProjectID
                     FROM WindowTitles
-                    WHERE ID IN ({title_ids_str})
+                    WHERE ID IN (SELECT value FROM json_each(?))
                     """,
-                    title_ids
+                    (json.dumps(title_ids),)
                 )
                 titles_info = cursor.fetchall()
                 
                 if len(titles_info) < 2:
-                    print("Not enough valid titles found for merging")
+                    logger.warning("Not enough valid titles found for merging")
                     return False
                 
                 # First ID in the list is our target ID that we want to keep
@@ -621,38 +1039,40 @@ class DatabaseManager:
                         break
                 
                 if target_project_id is None:
-                    print(f"Target title ID {target_id} not found")
+                    logger.warning("Target title ID %s not found", target_id)
                     return False
                 
                 # IDs to remove (all except the target)
                 ids_to_remove = title_ids[1:]
-                to_remove_str = ','.join(['?'] * len(ids_to_remove))
                 
                 # Update all log entries from old titles to point to the target one
                 if ids_to_remove:
-                    cursor.execute(
-                        f"""
+                    to_remove = json.dumps(ids_to_remove)
+                    conn.execute(
+                        """
                         UPDATE WindowLog
                         SET TitleID = ?
-                        WHERE TitleID IN ({to_remove_str})
+                        WHERE TitleID IN (SELECT value FROM json_each(?))
                         """,
-                        [target_id] + ids_to_remove
+                        (target_id, to_remove)
                     )
                     
                     # Delete the old titles
-                    cursor.execute(
-                        f"""
+                    conn.execute(
+                        """
                         DELETE FROM WindowTitles
-                        WHERE ID IN ({to_remove_str})
+                        WHERE ID IN (SELECT value FROM json_each(?))
                         """,
-                        ids_to_remove
+                        (to_remove,)
                     )
                 
                 conn.commit()
+                self._open_log_id = None  # May now belong to a different title
+                self.mark_changed()
                 return True
 
         except Exception as e:
-            print(f"Error merging titles: {e}")
+            logger.error("Error merging titles: %s", e)
             return False
 
     def get_log_entries_count(self) -> Dict[int, int]:
@@ -663,18 +1083,40 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+                cursor = conn.execute(
                     """
                     SELECT TitleID, COUNT(*) as count
                     FROM WindowLog
                     GROUP BY TitleID
                     """
                 )
-                return {row['TitleID']: row['count'] for row in cursor.fetchall()}
+                cursor.row_factory = None  # Plain tuples, read by position
+                return dict(cursor.fetchall())
+
+        except Exception as e:
+            logger.error("Error getting log entries count: %s", e)
+            return {}
+
+    def get_title_counts_by_project(self) -> Dict[int, int]:
+        """Get the number of window titles assigned to each project.
+
+        Returns:
+            Dictionary mapping project ID to count of titles, projects without titles are missing
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT ProjectID, COUNT(*) as count
+                    FROM WindowTitles
+                    GROUP BY ProjectID
+                    """
+                )
+                cursor.row_factory = None  # Plain tuples, read by position
+                return dict(cursor.fetchall())
 
         except Exception as e:
-            print(f"Error getting log entries count: {e}")
+            logger.error("Error getting title counts by project: %s", e)
             return {}
 
     def get_titles_by_project(self, project_id: int) -> List[Dict[str, Any]]:
@@ -688,8 +1130,7 @@ class DatabaseManager:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+                cursor = conn.execute(
                     """
                     SELECT ID, Title
                     FROM WindowTitles
@@ -698,15 +1139,10 @@ class DatabaseManager:
                     """,
                     (project_id,)
                 )
+                cursor.row_factory = None  # Plain tuples, read by position
                 
-                titles = []
-                for row in cursor.fetchall():
-                    titles.append({
-                        'id': row['ID'],
-                        'title': row['Title']
-                    })
-                return titles
+                return [{'id': title_id, 'title': title} for title_id, title in cursor.fetchall()]
 
         except Exception as e:
-            print(f"Error getting titles by project: {e}")
+            logger.error("Error getting titles by project: %s", e)
             return []
@@ -3,7 +3,7 @@ HTML export generator for creating self-contained activity reports.
 """
 from datetime import datetime, timedelta
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import io
 from PIL import Image, ImageDraw, ImageFont
 
@@ -25,9 +25,8 @@ class HTMLExportGenerator:
         Returns:
             A self-contained HTML report as a string
         """
-        # Get data
-        project_data = self._db_manager.get_project_summary(start_time, end_time)
-        title_data = self._db_manager.get_title_summary(start_time, end_time)
+        # Get data, both summaries from one pass over the log
+        title_data, project_data = self._db_manager.get_combined_summary(start_time, end_time)
 
         # Format project data for chart
         chart_data = [(name, duration) for _, name, duration in project_data]
@@ -154,19 +153,27 @@ class HTMLExportGenerator:
         svg += '</svg>'
         return svg
 
-    def generate_project_chart_png(self, start_time: datetime, end_time: datetime, size: int = 400) -> Image.Image:
+    def generate_project_chart_png(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        size: int = 400,
+        project_data: Optional[List[Tuple[int, str, float]]] = None
+    ) -> Image.Image:
         """Generate a PNG image of the project distribution pie chart.
         
         Args:
             start_time: Start of the reporting period
             end_time: End of the reporting period
             size: Size of the output image in pixels (square)
+            project_data: Project summary of the period if already fetched, queried otherwise
 
         Returns:
             PIL Image object containing the pie chart
         """
         # Get data
-        project_data = self._db_manager.get_project_summary(start_time, end_time)
+        if project_data is None:
+            project_data = self._db_manager.get_project_summary(start_time, end_time)
         chart_data = [(name, duration) for _, name, duration in project_data]
         
         # Create image with 2x size for antialiasing
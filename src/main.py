@@ -1,10 +1,10 @@
 """
 Main entry point for the Window Activity Logger application.
 """
+import logging
 import os
 import sys
 import signal
-import time
 from pathlib import Path
 
 # Add the parent directory to Python path so modules can be found
@@ -14,41 +14,55 @@ if str(current_dir) not in sys.path:
 
 from application import Application
 
+logger = logging.getLogger(__name__)
+
+# Interval of the Tk loop heartbeat, signal handlers only run once it wakes up
+_SIGNAL_CHECK_MS = 250
+
 def main() -> int:
     """Main entry point.
 
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+    )
+
     try:
         # Create and initialize application
         app = Application()
         if not app.initialize():
-            print("Failed to initialize application")
+            logger.error("Failed to initialize application")
             return 1
 
         # Set up signal handlers
         def handle_signal(signum, frame):
-            print("\nReceived exit signal, shutting down...")
+            logger.info("Received exit signal, shutting down...")
             app.stop()
             sys.exit(0)
         
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
 
-        # Start the application and keep it running
+        # Python runs signal handlers only between bytecodes, the hidden root is
+        # usually idle, so wake the Tk loop regularly for Ctrl+C and kill
+        def heartbeat():
+            if app.root:
+                app.root.after(_SIGNAL_CHECK_MS, heartbeat)
+
+        # Start the application and run the Tk event loop until the root is destroyed
         app.start()
-        while app.is_running:  # Use property instead of protected member
-            # Process any pending UI events
-            app.process_ui_events()
-            time.sleep(0.1)  # More responsive sleep interval
+        heartbeat()
+        app.root.mainloop()
 
         # Clean exit
         app.stop()  # Ensure everything is stopped
         return 0
 
     except Exception as e:
-        print(f"Unhandled error: {e}")
+        logger.exception("Unhandled error: %s", e)
         return 1
 
 if __name__ == "__main__":
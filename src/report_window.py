@@ -1,6 +1,7 @@
 """
 Report window for displaying activity statistics and managing projects.
 """
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Optional, Dict, List, Tuple, cast
@@ -12,6 +13,8 @@ from db_manager import DatabaseManager
 from html_export import HTMLExportGenerator
 
 # Time range options
+logger = logging.getLogger(__name__)
+
 TIME_RANGES = {
     "Day": timedelta(days=1),
     "Week": timedelta(days=7),
@@ -131,14 +134,18 @@ class ReportWindow:
         self.chart_canvas.pack(pady=10)
         self.chart_image = None  # Store reference to prevent garbage collection
 
-    def _update_pie_chart(self, start_time: datetime, end_time: datetime) -> None:
+    def _update_pie_chart(
+        self, start_time: datetime, end_time: datetime, project_data: List[Tuple[int, str, float]]
+    ) -> None:
         """Update the pie chart with new data."""
         if not hasattr(self, 'chart_canvas') or not self.chart_canvas.winfo_exists():
             return
 
         try:
             # Generate chart image
-            pil_image = self._html_generator.generate_project_chart_png(start_time, end_time)
+            pil_image = self._html_generator.generate_project_chart_png(
+                start_time, end_time, project_data=project_data
+            )
             
             # Convert PIL image to Tkinter PhotoImage
             self.chart_image = ImageTk.PhotoImage(pil_image)
@@ -151,7 +158,7 @@ class ReportWindow:
                 anchor=tk.CENTER
             )
         except Exception as e:
-            print(f"Error updating pie chart: {e}")
+            logger.error("Error updating pie chart: %s", e)
             # Show error message in canvas
             self.chart_canvas.delete("all")
             self.chart_canvas.create_text(
@@ -241,7 +248,7 @@ class ReportWindow:
             # Ignore KeyError from popup windows
             pass
         except Exception as e:
-            print(f"Focus check error: {e}")
+            logger.error("Focus check error: %s", e)
 
     def _handle_title_click(self, event) -> None:
         """Handle clicks in the title table to show project combobox."""
@@ -334,14 +341,17 @@ class ReportWindow:
             end_time = datetime.now()
             start_time = end_time - TIME_RANGES[range_name]
 
+            # Both summaries come from one pass over the log
+            title_data, project_data = self._db_manager.get_combined_summary(start_time, end_time)
+
             # Update pie chart
-            self._update_pie_chart(start_time, end_time)
+            self._update_pie_chart(start_time, end_time, project_data)
 
             # Update project summary
-            self._update_project_data(start_time, end_time)
+            self._update_project_data(project_data)
 
             # Update title summary
-            self._update_title_data(start_time, end_time)
+            self._update_title_data(title_data)
 
         except Exception as e:
             messagebox.showerror("[W.A.L.] - Error", f"Failed to refresh data: {e}")
@@ -355,17 +365,17 @@ class ReportWindow:
             return f"{hours}h {minutes}m"
         return f"{minutes}m"
 
-    def _update_project_data(self, start_time: datetime, end_time: datetime) -> None:
+    def _update_project_data(self, project_data: List[Tuple[int, str, float]]) -> None:
         """Update the project summary table."""
         if not self._project_tree:
             return
 
-        # Clear existing items
-        for item in self._project_tree.get_children():
-            self._project_tree.delete(item)
+        # Clear existing items in a single call
+        children = self._project_tree.get_children()
+        if children:
+            self._project_tree.delete(*children)
 
-        # Get and display project data
-        project_data = self._db_manager.get_project_summary(start_time, end_time)
+        # Display project data
         for project_id, name, duration in project_data:
             self._project_tree.insert(
                 "",
@@ -373,17 +383,17 @@ class ReportWindow:
                 values=(project_id, name, self._format_duration(duration))
             )
 
-    def _update_title_data(self, start_time: datetime, end_time: datetime) -> None:
+    def _update_title_data(self, title_data: List[Tuple[str, float, int]]) -> None:
         """Update the title summary table."""
         if not self._title_tree:
             return
 
-        # Clear existing items
-        for item in self._title_tree.get_children():
-            self._title_tree.delete(item)
+        # Clear existing items in a single call
+        children = self._title_tree.get_children()
+        if children:
+            self._title_tree.delete(*children)
 
-        # Get and display title data
-        title_data = self._db_manager.get_title_summary(start_time, end_time)
+        # Display title data
         projects = self._db_manager.get_projects()
         
         for title, duration, project_id in title_data:
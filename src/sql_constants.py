@@ -12,7 +12,7 @@ SELECT name FROM sqlite_master;"""
 DELETE_OLD_LOGS = """/* WARNING: This query deletes data permanently! */
 
 DELETE FROM WindowLog
-WHERE StartTimestamp < datetime('now', '-1 year');"""
+WHERE StartTimestamp < CAST(strftime('%s', 'now', '-1 year') AS INTEGER);"""
 
 # Query to delete titles with "DEMO" and their logs
 DELETE_DEMO_TITLES = """/* WARNING: This query deletes data permanently! */
@@ -46,11 +46,10 @@ ORDER BY wt.Title;"""
 # Query to select all logs
 SELECT_LOGS = """/* List recent window logs */
 
-SELECT wl.ID, wt.Title, wl.StartTimestamp, wl.EndTimestamp,
-       CASE
-           WHEN wl.EndTimestamp IS NULL THEN 0
-           ELSE strftime('%s', wl.EndTimestamp) - strftime('%s', wl.StartTimestamp)
-       END as Duration
+SELECT wl.ID, wt.Title,
+       datetime(wl.StartTimestamp, 'unixepoch', 'localtime') as StartTime,
+       datetime(wl.EndTimestamp, 'unixepoch', 'localtime') as EndTime,
+       IFNULL(wl.EndTimestamp - wl.StartTimestamp, 0) as Duration
 FROM WindowLog wl
 JOIN WindowTitles wt ON wl.TitleID = wt.ID
 ORDER BY wl.StartTimestamp DESC
@@ -59,11 +58,10 @@ LIMIT 100;"""
 # Query to select logs for titles containing "DEMO"
 SELECT_DEMO_LOGS = """/* List logs for titles containing "DEMO" */
 
-SELECT wl.ID, wt.Title, wl.StartTimestamp, wl.EndTimestamp,
-       CASE
-           WHEN wl.EndTimestamp IS NULL THEN 0
-           ELSE strftime('%s', wl.EndTimestamp) - strftime('%s', wl.StartTimestamp)
-       END as Duration
+SELECT wl.ID, wt.Title,
+       datetime(wl.StartTimestamp, 'unixepoch', 'localtime') as StartTime,
+       datetime(wl.EndTimestamp, 'unixepoch', 'localtime') as EndTime,
+       IFNULL(wl.EndTimestamp - wl.StartTimestamp, 0) as Duration
 FROM WindowLog wl
 JOIN WindowTitles wt ON wl.TitleID = wt.ID
 WHERE wt.Title LIKE '%DEMO%'
@@ -386,6 +386,7 @@ class SQLQueryWindow:
                 # Commit the transaction if we had any successes
                 if had_success:
                     conn.commit()
+                    self._db_manager.mark_changed()
 
         except Exception as e:
             # Handle any unexpected errors
@@ -4,9 +4,12 @@ System tray interface for providing application controls.
 from pathlib import Path
 from typing import Callable, Optional, Any
 import threading
+import logging
 import pystray
 from PIL import Image
 
+logger = logging.getLogger(__name__)
+
 # Type aliases to avoid forward reference issues
 Icon = Any  # pystray.Icon
 MenuItem = Any  # pystray.MenuItem
@@ -54,7 +57,7 @@ class SystemTrayInterface:
             return True
 
         except Exception as e:
-            print(f"Error initializing system tray: {e}")
+            logger.error("Error initializing system tray: %s", e)
             return False
 
     def cleanup(self) -> None:
@@ -65,7 +68,7 @@ class SystemTrayInterface:
                 self._icon = None
 
         except Exception as e:
-            print(f"Error cleaning up system tray: {e}")
+            logger.error("Error cleaning up system tray: %s", e)
 
     def set_exit_callback(self, callback: Callable[[], None]) -> None:
         """Set the callback for exit menu item."""
@@ -2,6 +2,7 @@
 Window monitor thread for tracking active window titles.
 """
 import ctypes
+import logging
 import threading
 import time
 from datetime import datetime
@@ -15,6 +16,8 @@ import win32ts
 if TYPE_CHECKING:
     from application import Application
 
+logger = logging.getLogger(__name__)
+
 class WindowMonitor:
     # Windows API constants
     WTS_CURRENT_SERVER_HANDLE = 0
@@ -51,7 +54,7 @@ class WindowMonitor:
             self._app.configuration.add_update_handler(self._handle_config_update)
             return True
         except Exception as e:
-            print(f"Error initializing window monitor: {e}")
+            logger.error("Error initializing window monitor: %s", e)
             return False
 
     def _handle_config_update(self) -> None:
@@ -62,7 +65,7 @@ class WindowMonitor:
                 if new_interval != self._polling_interval:
                     self._polling_interval = max(1, new_interval)  # Ensure minimum 1 second
         except Exception as e:
-            print(f"Error handling configuration update: {e}")
+            logger.error("Error handling configuration update: %s", e)
 
     def _get_polling_interval(self) -> int:
         """Get the current polling interval in a thread-safe way.
@@ -94,7 +97,7 @@ class WindowMonitor:
                 return True
 
         except Exception as e:
-            print(f"Error starting window monitor: {e}")
+            logger.error("Error starting window monitor: %s", e)
             self._is_running = False
             return False
 
@@ -156,7 +159,7 @@ class WindowMonitor:
                 self._interruptible_sleep(self._get_polling_interval())
 
             except Exception as e:
-                print(f"Error in monitor loop: {e}")
+                logger.error("Error in monitor loop: %s", e)
                 self._interruptible_sleep(self._get_polling_interval())
 
     def _interruptible_sleep(self, seconds: int) -> None:
@@ -212,7 +215,7 @@ class WindowMonitor:
             return title
 
         except Exception as e:
-            print(f"Error getting window title: {e}")
+            logger.error("Error getting window title: %s", e)
             return ""
 
     def _is_system_inactive(self) -> bool:
@@ -241,5 +244,5 @@ class WindowMonitor:
             return False
 
         except Exception as e:
-            print(f"Error checking system state: {e}")
+            logger.error("Error checking system state: %s", e)
             return False